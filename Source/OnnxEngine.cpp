@@ -250,6 +250,11 @@ int OnnxEngine::loadModelsFromConfig(const juce::String& configPath)
     
     for (auto& prop : obj->getProperties())
     {
+        // Only plain role -> path entries name models; object values such as
+        // "session_hints" are metadata for other tools
+        if (!prop.value.isString())
+            continue;
+        
         juce::String role = prop.name.toString();
         juce::String path = prop.value.toString();
         
@@ -19,7 +19,10 @@ import os
 import json
 import sys
 import io
+import tempfile
+import shutil
 
+import numpy as np
 # Configure UTF-8 encoding for stdout to prevent UnicodeEncodeError
 if not sys.stdout.encoding or sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -27,17 +30,29 @@ if not sys.stdout.encoding or sys.stdout.encoding.lower() not in ('utf-8', 'utf8
 try:
     import torch
     import torch.nn as nn
+    import torch.nn.utils.prune as prune
     TORCH_AVAILABLE = True
 except ImportError:
     TORCH_AVAILABLE = False
     print("Warning: PyTorch not available. Install with: pip install torch")
 
+try:
+    from torch._subclasses.fake_tensor import FakeTensor, FakeTensorMode
+except ImportError:
+    FakeTensor = FakeTensorMode = None
+
 try:
     import onnx
     ONNX_AVAILABLE = True
 except ImportError:
     ONNX_AVAILABLE = False
 
+try:
+    import onnxruntime
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
 
 class SimpleTTSModel(nn.Module):
     """
@@ -95,13 +110,16 @@ class SimpleHiFiGAN(nn.Module):
         
         self.conv_post = nn.Conv1d(out_channels, 1, 7, 1, 3)
         self.tanh = nn.Tanh()
+        
+        # One activation module per stage so conv + activation pairs can be fused
+        self.acts = nn.ModuleList([nn.ReLU() for _ in range(len(self.ups) + 1)])
     
     def forward(self, x):
         x = self.conv_pre(x)
-        for up in self.ups:
-            x = torch.relu(x)
+        for act, up in zip(self.acts, self.ups):
+            x = act(x)
             x = up(x)
-        x = torch.relu(x)
+        x = self.acts[-1](x)
         x = self.conv_post(x)
         x = self.tanh(x)
         return x.squeeze(1)
@@ -115,13 +133,14 @@ class VocalEmbeddingModel(nn.Module):
     def __init__(self, config=None):
         super().__init__()
         
-        # Default configuration
-        self.config = config or {
+        # Default configuration, overridden by any keys in config
+        self.config = {
             'input_dim': 256,
             'hidden_dim': 512,
             'output_dim': 80,  # Mel-spectrogram bins
             'num_layers': 4
         }
+        self.config.update(config or {})
         
         # Build network
         layers = []
@@ -148,7 +167,154 @@ class VocalEmbeddingModel(nn.Module):
         return self.network(x)
 
 
-def load_pth_model(pth_path, model_type='tts', config=None):
+def _linear_relu_indices(seq):
+    """
+    Find the (Linear, ReLU) index pairs in a Sequential that can be fused.
+    
+    Linear -> LayerNorm -> ReLU blocks are not returned: PyTorch has no fused
+    module for them, and opset 18 already exports LayerNorm as a single
+    LayerNormalization node.
+    
+    Args:
+        seq: nn.Sequential to scan
+    
+    Returns:
+        List of index groups, e.g. [['0', '1'], ['2', '3']]
+    """
+    modules = list(seq)
+    groups = []
+    for i in range(len(modules) - 1):
+        if isinstance(modules[i], nn.Linear) and isinstance(modules[i + 1], nn.ReLU):
+            groups.append([str(i), str(i + 1)])
+    return groups
+
+
+def fuse_linear_blocks(model):
+    """
+    Fuse consecutive Linear + ReLU modules in ``model.network`` in place.
+    
+    Models without a Sequential ``network`` attribute are returned unchanged.
+    
+    Args:
+        model: PyTorch model in eval mode
+    
+    Returns:
+        The same model, with fused LinearReLU modules
+    """
+    network = getattr(model, 'network', None)
+    if not isinstance(network, nn.Sequential):
+        return model
+    
+    groups = [[f"network.{i}" for i in group] for group in _linear_relu_indices(network)]
+    if groups:
+        torch.ao.quantization.fuse_modules(model, groups, inplace=True)
+        print(f"Fused {len(groups)} Linear+ReLU block(s)")
+    
+    return model
+
+
+def prune_model(model, amount=0.3):
+    """
+    Zero out the smallest-magnitude Linear weights across the whole model.
+    
+    Uses global L1 unstructured pruning, then removes the pruning
+    re-parametrization so the zeros are baked into the exported weights.
+    
+    Args:
+        model: PyTorch model
+        amount: Fraction of Linear weights to prune (0-1)
+    
+    Returns:
+        The same model, pruned in place
+    """
+    params = [(m, 'weight') for m in model.modules() if isinstance(m, nn.Linear)]
+    if not params:
+        return model
+    
+    prune.global_unstructured(params, pruning_method=prune.L1Unstructured, amount=amount)
+    for module, name in params:
+        prune.remove(module, name)
+    
+    print(f"Pruned {amount:.0%} of weights across {len(params)} Linear layer(s)")
+    return model
+
+
+def fuse_vocoder_blocks(model):
+    """
+    Fuse the HiFi-GAN input convolution with its activation in place.
+    
+    Only conv_pre + acts.0 is fusable: PyTorch has no fused module for
+    ConvTranspose1d + ReLU, and the upsampling stages apply their
+    activation before the transposed convolution.
+    
+    Args:
+        model: PyTorch model in eval mode
+    
+    Returns:
+        The same model, with a fused ConvReLU1d input stage
+    """
+    if not isinstance(model, SimpleHiFiGAN):
+        return model
+    
+    torch.ao.quantization.fuse_modules(model, [['conv_pre', 'acts.0']], inplace=True)
+    print("Fused 1 Conv1d+ReLU block")
+    return model
+
+
+def optimize_onnx_graph(model_path, output_path):
+    """
+    Run onnxoptimizer fusion passes and onnx-simplifier over an exported model.
+    
+    The result is always written to output_path as a single self-contained
+    file. onnxoptimizer and onnxsim are optional; each step is skipped if the
+    package is not installed or the pass fails.
+    
+    Args:
+        model_path: Path to the exported ONNX model
+        output_path: Output path for the optimized ONNX model
+    """
+    if not ONNX_AVAILABLE:
+        shutil.copyfile(model_path, output_path)
+        return
+    
+    onnx_model = onnx.load(model_path)
+    try:
+        import onnxoptimizer
+        onnx_model = onnxoptimizer.optimize(
+            onnx_model,
+            [
+                'eliminate_identity',
+                'eliminate_nop_transpose',
+                'fuse_bn_into_conv',
+                'fuse_add_bias_into_conv',
+                'fuse_consecutive_transposes',
+                'fuse_matmul_add_bias_into_gemm',
+            ]
+        )
+        print("[OK] onnxoptimizer passes applied")
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"Warning: onnxoptimizer passes failed: {e}")
+    
+    # onnx-simplifier folds constant subgraphs the exporter leaves behind
+    try:
+        from onnxsim import simplify
+        simplified, ok = simplify(onnx_model)
+        if ok:
+            onnx_model = simplified
+            print("[OK] onnxsim simplification applied")
+        else:
+            print("Warning: onnxsim could not validate the simplified model")
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"Warning: onnxsim simplification failed: {e}")
+    
+    onnx.save(onnx_model, output_path)
+
+
+def load_pth_model(pth_path, model_type='tts', config=None, prune_amount=0.0):
     """
     Load a PyTorch model from a .pth file.
     
@@ -156,6 +322,7 @@ def load_pth_model(pth_path, model_type='tts', config=None):
         pth_path: Path to the .pth file
         model_type: Type of model ('tts', 'hifigan', 'vocal_embedding')
         config: Optional model configuration dict
+        prune_amount: Fraction of Linear weights to prune before export
     
     Returns:
         Loaded PyTorch model
@@ -167,13 +334,24 @@ def load_pth_model(pth_path, model_type='tts', config=None):
         raise FileNotFoundError(f"Model file not found: {pth_path}")
     
     print(f"Loading .pth model from: {pth_path}")
-    print("WARNING: Only load .pth files from trusted sources. "
-          "Untrusted files may contain malicious code.")
     
-    # Load the checkpoint
-    # Note: weights_only=False is required for full model loading but poses security risks
-    # with untrusted files. Only load models from trusted sources.
-    checkpoint = torch.load(pth_path, map_location='cpu', weights_only=False)
+    # Load the checkpoint. PyTorch 2.1+ can memory-map tensor storages and
+    # restrict unpickling to plain tensors/containers, which avoids holding
+    # a second full copy of the weights in RAM.
+    checkpoint = None
+    torch_version = tuple(int(v) for v in torch.__version__.split('+')[0].split('.')[:2])
+    if torch_version >= (2, 1):
+        try:
+            checkpoint = torch.load(pth_path, map_location='cpu', weights_only=True, mmap=True)
+        except Exception as e:
+            print(f"Warning: Memory-mapped weights-only load failed ({type(e).__name__})")
+    
+    if checkpoint is None:
+        # Note: weights_only=False is required for full model loading but poses security risks
+        # with untrusted files. Only load models from trusted sources.
+        print("WARNING: Falling back to full unpickling. Only load .pth files from trusted sources. "
+              "Untrusted files may contain malicious code.")
+        checkpoint = torch.load(pth_path, map_location='cpu', weights_only=False)
     
     # Determine model architecture
     if model_type == 'tts':
@@ -206,36 +384,259 @@ def load_pth_model(pth_path, model_type='tts', config=None):
     
     # Try to load state dict
     try:
-        model.load_state_dict(state_dict, strict=False)
+        try:
+            # assign=True (PyTorch 2.1+) rebinds the loaded, memory-mapped tensors
+            # as parameters instead of copying them into freshly allocated ones
+            model.load_state_dict(state_dict, strict=False, assign=True)
+        except TypeError:
+            model.load_state_dict(state_dict, strict=False)
         print("Model weights loaded successfully")
     except Exception as e:
         print(f"Warning: Could not load all weights ({e})")
         print("Proceeding with randomly initialized weights")
     
+    if prune_amount > 0:
+        prune_model(model, prune_amount)
+    
     model.eval()
+    fuse_linear_blocks(model)
+    fuse_vocoder_blocks(model)
     return model
 
 
-def export_to_onnx(model, output_path, model_type='tts', config=None):
+class MelCalibReader:
+    """
+    Calibration data reader for ONNX Runtime static quantization.
+    Yields random mel-spectrogram batches for the HiFi-GAN vocoder input.
+    """
+    def __init__(self, input_name='mel_spectrogram', mel_channels=80, time_frames=100,
+                 num_batches=12, batch_size=1):
+        self.batches = iter([
+            {input_name: np.random.randn(batch_size, mel_channels, time_frames).astype(np.float32)}
+            for _ in range(num_batches)
+        ])
+    
+    def get_next(self):
+        return next(self.batches, None)
+
+
+def quantize_onnx_model(fp32_path, output_path, mode='dynamic', calibration_reader=None):
+    """
+    Quantize an FP32 ONNX model to INT8 with ONNX Runtime.
+    
+    PyTorch's quantized modules cannot be exported to ONNX, so quantization
+    is applied to the exported graph instead. 'dynamic' quantizes weights
+    only; 'static' also quantizes activations to a QDQ graph using
+    calibration data, which covers the vocoder convolutions.
+    
+    Args:
+        fp32_path: Path to the FP32 ONNX model
+        output_path: Output path for the quantized ONNX model
+        mode: Quantization mode ('dynamic' or 'static')
+        calibration_reader: Calibration data reader (required for 'static')
+    """
+    if not ORT_AVAILABLE:
+        raise RuntimeError("ONNX Runtime is required for quantization. Install with: pip install onnxruntime")
+    
+    from onnxruntime.quantization import quantize_dynamic, quantize_static, QuantFormat, QuantType
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Pre-processing refreshes the shape info that quantization relies on
+        prep_path = os.path.join(tmp_dir, 'prep.onnx')
+        quant_pre_process(fp32_path, prep_path)
+        
+        if mode == 'dynamic':
+            quantize_dynamic(prep_path, output_path, weight_type=QuantType.QInt8)
+        elif mode == 'static':
+            if calibration_reader is None:
+                raise ValueError("Static quantization requires a calibration data reader")
+            quantize_static(
+                prep_path,
+                output_path,
+                calibration_reader,
+                quant_format=QuantFormat.QDQ,
+                activation_type=QuantType.QInt8,
+                weight_type=QuantType.QInt8
+            )
+        else:
+            raise ValueError(f"Unknown quantization mode: {mode}")
+    
+    print(f"[OK] INT8 {mode} quantization applied")
+
+
+def optimized_model_path(model_path):
+    """Return the path of the ORT-optimized copy of an ONNX model."""
+    return os.path.splitext(model_path)[0] + '.opt.onnx'
+
+
+def external_data_name(model_path):
+    """Return the file name of the weights sidecar for an ONNX model"""
+    return os.path.basename(model_path) + '.data'
+
+
+def remove_external_data(model_path):
+    """Delete a stale weights sidecar; onnx and ORT append to existing files"""
+    data_path = os.path.join(os.path.dirname(model_path), external_data_name(model_path))
+    if os.path.exists(data_path):
+        os.remove(data_path)
+
+
+def save_onnx_model(onnx_model, output_path, size_threshold=1024):
+    """
+    Save an ONNX model with its weights in a ``<name>.onnx.data`` sidecar.
+    
+    Keeping the weights outside the protobuf lets ONNX Runtime memory-map
+    them at load time instead of parsing them into the model proto.
+    
+    Args:
+        onnx_model: ONNX ModelProto
+        output_path: Output path for the ONNX model
+        size_threshold: Tensors smaller than this many bytes stay inline
+    """
+    remove_external_data(output_path)
+    onnx.save_model(
+        onnx_model,
+        output_path,
+        save_as_external_data=True,
+        all_tensors_to_one_file=True,
+        location=external_data_name(output_path),
+        size_threshold=size_threshold
+    )
+
+
+def save_optimized_model(model_path):
+    """
+    Run ONNX Runtime graph optimizations on an exported model and save the
+    optimized graph next to it as ``*.opt.onnx``.
+    
+    Only ORT_ENABLE_EXTENDED is applied: ORT_ENABLE_ALL adds layout
+    transforms tied to the provider that ran them, so the saved graph would
+    only be valid on the CPU.
+    
+    Args:
+        model_path: Path to the exported ONNX model
+    
+    Returns:
+        Path to the optimized model, or None if ONNX Runtime is unavailable
+    """
+    if not ORT_AVAILABLE:
+        print("Warning: ONNX Runtime not available, skipping graph optimization")
+        return None
+    
+    opt_path = optimized_model_path(model_path)
+    
+    sess_options = onnxruntime.SessionOptions()
+    sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    sess_options.optimized_model_filepath = opt_path
+    remove_external_data(opt_path)
+    sess_options.add_session_config_entry(
+        'session.optimized_model_external_initializers_file_name', external_data_name(opt_path)
+    )
+    sess_options.add_session_config_entry(
+        'session.optimized_model_external_initializers_min_size_in_bytes', '1024'
+    )
+    try:
+        onnxruntime.InferenceSession(model_path, sess_options, providers=['CPUExecutionProvider'])
+    except Exception as e:
+        print(f"Warning: Graph optimization skipped: {e}")
+        return None
+    
+    print(f"[OK] Optimized model saved to: {opt_path}")
+    return opt_path
+
+
+def convert_onnx_to_fp16(fp32_path, output_path):
+    """
+    Convert the weights and activations of an ONNX model to FP16.
+    
+    Inputs and outputs stay FP32 so existing callers can keep feeding
+    float tensors.
+    
+    Args:
+        fp32_path: Path to the FP32 ONNX model
+        output_path: Output path for the FP16 ONNX model
+    """
+    if not ONNX_AVAILABLE:
+        raise RuntimeError("ONNX is required for fp16 export. Install with: pip install onnx")
+    
+    try:
+        from onnxconverter_common import float16
+    except ImportError:
+        raise RuntimeError("onnxconverter-common is required for fp16 export. "
+                           "Install with: pip install onnxconverter-common")
+    
+    model_fp16 = float16.convert_float_to_float16(onnx.load(fp32_path), keep_io_types=True)
+    onnx.save(model_fp16, output_path)
+    print("[OK] Converted model to FP16")
+
+
+def is_fake_tensor(tensor):
+    """Return True if tensor is a storage-free FakeTensor"""
+    return FakeTensor is not None and isinstance(tensor, FakeTensor)
+
+
+def make_dummy_input(shape, dtype):
+    """
+    Create a dummy tracing input without allocating its data.
+    
+    The exporter only records shapes and dtypes, so the dummy is a FakeTensor
+    (meta-backed, no storage). Plain meta tensors are rejected by
+    torch.export when the model weights live on the CPU, which FakeTensors
+    avoid. Falls back to an uninitialized CPU tensor if FakeTensorMode is
+    unavailable; the values are never read, so no fill pass is needed.
+    
+    Args:
+        shape: Input shape
+        dtype: Input dtype
+    
+    Returns:
+        Dummy input tensor
+    """
+    if FakeTensorMode is None:
+        return torch.empty(shape, dtype=dtype)
+    
+    with FakeTensorMode(allow_non_fake_inputs=True):
+        return torch.empty(shape, dtype=dtype)
+
+
+def export_to_onnx(model, output_path, model_type='tts', config=None, quantize='none',
+                   static_shapes=True, dtype='fp32', batch_size=1, validate=True):
     """
     Export a PyTorch model to ONNX format.
     
+    Static shapes let ONNX Runtime constant-fold and specialize the graph;
+    the HiFi-GAN time dimension is then fixed to config['time_frames'].
+    batch_size sets the traced batch; with dynamic shapes it should reflect
+    the serving batch so ORT selects batched GEMM kernels.
+    
     Args:
         model: PyTorch model
         output_path: Output path for the ONNX file
         model_type: Type of model ('tts', 'hifigan', 'vocal_embedding')
         config: Optional configuration
+        quantize: Quantization mode ('none', 'dynamic' or 'static')
+        static_shapes: Export with fixed input shapes instead of dynamic axes
+        dtype: Weight precision ('fp32', 'fp16' or 'bf16'); bf16 models use
+            bfloat16 inputs/outputs and target GPU execution providers
+        batch_size: Batch dimension of the dummy input used for tracing
+        validate: Run the ONNX checker on the exported model
     """
     if not TORCH_AVAILABLE:
         raise RuntimeError("PyTorch is required. Install with: pip install torch")
     
     print(f"Exporting model to ONNX: {output_path}")
     
+    if quantize == 'static' and model_type != 'hifigan':
+        # Calibration data is only defined for mel-spectrogram inputs
+        print("Note: static quantization is only used for hifigan; using dynamic quantization")
+        quantize = 'dynamic'
+    
     # Create dummy input based on model type
     if model_type == 'tts':
         # TTS input: text embeddings [batch, seq_len, embed_dim]
         input_dim = config.get('input_dim', 512) if config else 512
-        dummy_input = torch.randn(1, input_dim)
+        input_shape = (batch_size, input_dim)
         input_names = ['text_embedding']
         output_names = ['mel_spectrogram']
         dynamic_axes = {
@@ -245,7 +646,8 @@ def export_to_onnx(model, output_path, model_type='tts', config=None):
     elif model_type == 'hifigan':
         # HiFi-GAN input: mel-spectrogram [batch, mel_channels, time]
         mel_channels = config.get('mel_channels', 80) if config else 80
-        dummy_input = torch.randn(1, mel_channels, 100)
+        time_frames = config.get('time_frames', 100) if config else 100
+        input_shape = (batch_size, mel_channels, time_frames)
         input_names = ['mel_spectrogram']
         output_names = ['audio']
         dynamic_axes = {
@@ -254,7 +656,7 @@ def export_to_onnx(model, output_path, model_type='tts', config=None):
         }
     elif model_type == 'vocal_embedding':
         input_dim = config.get('input_dim', 256) if config else 256
-        dummy_input = torch.randn(1, input_dim)
+        input_shape = (batch_size, input_dim)
         input_names = ['input']
         output_names = ['output']
         dynamic_axes = {
@@ -264,37 +666,84 @@ def export_to_onnx(model, output_path, model_type='tts', config=None):
     else:
         raise ValueError(f"Unknown model type: {model_type}")
     
+    if static_shapes:
+        dynamic_axes = None
+    
+    input_dtype = torch.float32
+    if dtype == 'bf16':
+        model = model.to(torch.bfloat16)
+        input_dtype = torch.bfloat16
+    
     # Create output directory
     os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
     
-    # Export to ONNX
-    torch.onnx.export(
-        model,
-        dummy_input,
-        output_path,
-        export_params=True,
-        opset_version=18,
-        do_constant_folding=True,
-        input_names=input_names,
-        output_names=output_names,
-        dynamic_axes=dynamic_axes
-    )
+    # Export to ONNX via a temporary file, then post-process into output_path
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export_path = os.path.join(tmp_dir, 'export.onnx')
+        
+        def _export(dummy_input):
+            # Trace without autograd bookkeeping (no grad graph or version counters)
+            with torch.inference_mode():
+                torch.onnx.export(
+                    model,
+                    dummy_input,
+                    export_path,
+                    export_params=True,
+                    opset_version=18,
+                    do_constant_folding=True,
+                    input_names=input_names,
+                    output_names=output_names,
+                    dynamic_axes=dynamic_axes
+                )
+        
+        dummy_input = make_dummy_input(input_shape, input_dtype)
+        try:
+            _export(dummy_input)
+        except Exception as e:
+            if not is_fake_tensor(dummy_input):
+                raise
+            print(f"Note: storage-free tracing failed ({type(e).__name__}); retrying with a CPU tensor")
+            _export(torch.empty(input_shape, dtype=input_dtype))
+        
+        graph_path = os.path.join(tmp_dir, 'graph.onnx')
+        optimize_onnx_graph(export_path, graph_path)
+        
+        final_path = os.path.join(tmp_dir, 'final.onnx')
+        if quantize != 'none':
+            calibration_reader = (
+                MelCalibReader(mel_channels=mel_channels, time_frames=time_frames, batch_size=batch_size)
+                if quantize == 'static' else None
+            )
+            quantize_onnx_model(graph_path, final_path, quantize, calibration_reader)
+        elif dtype == 'fp16':
+            convert_onnx_to_fp16(graph_path, final_path)
+        else:
+            final_path = graph_path
+        
+        if ONNX_AVAILABLE:
+            save_onnx_model(onnx.load(final_path), output_path)
+        else:
+            shutil.copyfile(final_path, output_path)
     
     print(f"[OK] Model exported successfully to: {output_path}")
     
-    # Verify ONNX model if onnx is available
-    if ONNX_AVAILABLE:
+    # Verify ONNX model if onnx is available; checking by path lets the
+    # checker parse the file natively instead of building a Python proto
+    if validate and ONNX_AVAILABLE:
         try:
-            onnx_model = onnx.load(output_path)
-            onnx.checker.check_model(onnx_model)
+            onnx.checker.check_model(output_path)
             print("[OK] ONNX model validation passed")
         except Exception as e:
             print(f"Warning: ONNX validation failed: {e}")
     
+    save_optimized_model(output_path)
+    
     return output_path
 
 
-def create_default_vocal_model(output_dir, model_type='tts'):
+def create_default_vocal_model(output_dir, model_type='tts', quantize='none',
+                               static_shapes=True, time_frames=100, dtype='fp32', batch_size=1,
+                               validate=False):
     """
     Create and export a default vocal model for the MAEVN pipeline.
     This is useful when no .pth file is provided.
@@ -302,6 +751,12 @@ def create_default_vocal_model(output_dir, model_type='tts'):
     Args:
         output_dir: Output directory for the ONNX model
         model_type: Type of model to create ('tts' or 'hifigan')
+        quantize: Quantization mode ('none', 'dynamic' or 'static')
+        static_shapes: Export with fixed input shapes instead of dynamic axes
+        time_frames: Mel frames per HiFi-GAN call when exporting static shapes
+        dtype: Weight precision ('fp32', 'fp16' or 'bf16')
+        batch_size: Batch dimension of the dummy input used for tracing
+        validate: Run the ONNX checker on the exported model
     
     Returns:
         Path to the exported ONNX model
@@ -320,24 +775,60 @@ def create_default_vocal_model(output_dir, model_type='tts'):
     elif model_type == 'hifigan':
         model = SimpleHiFiGAN(mel_channels=80)
         output_path = os.path.join(output_dir, 'vocals_hifigan.onnx')
-        config = {'mel_channels': 80}
+        config = {'mel_channels': 80, 'time_frames': time_frames}
     else:
         raise ValueError(f"Unknown model type: {model_type}")
     
     model.eval()
-    export_to_onnx(model, output_path, model_type, config)
+    fuse_linear_blocks(model)
+    fuse_vocoder_blocks(model)
+    export_to_onnx(model, output_path, model_type, config, quantize, static_shapes, dtype, batch_size,
+                   validate)
     
     return output_path
 
 
-def update_model_config(models_dir, model_name, model_path):
+def default_providers(quantize='none', dtype='fp32'):
+    """
+    Pick the ONNX Runtime execution providers a loader should request.
+    
+    INT8 models use CPU-only integer kernels (MatMulInteger / QLinear ops).
+    bf16 models need CUDA, since the CPU provider has no bfloat16 kernels.
+    Other float models prefer CUDA and fall back to the CPU.
+    
+    Args:
+        quantize: Quantization mode used for export
+        dtype: Weight precision used for export
+    
+    Returns:
+        Ordered list of execution provider names
+    """
+    if quantize != 'none':
+        return ['CPUExecutionProvider']
+    if dtype == 'bf16':
+        return ['CUDAExecutionProvider']
+    return ['CUDAExecutionProvider', 'CPUExecutionProvider']
+
+
+def update_model_config(models_dir, entries, providers=None, opt_level=99):
     """
-    Update the Models/config.json to include the new vocal model.
+    Update the Models/config.json to include the new vocal models.
+    
+    Each role maps to its model path, as the plugin's loader expects. Session
+    hints go under a separate ``session_hints`` key, which the loader skips:
+    ``{"providers": [...], "opt_level": 99, "optimized_path": ...}``.
+    opt_level follows ONNX Runtime's GraphOptimizationLevel (99 = ORT_ENABLE_ALL)
+    and applies to the file the loader opens. An optimized_path was already
+    optimized offline, so its entry carries 0 (ORT_DISABLE_ALL) instead.
+    All entries are applied in a single read-modify-write of config.json.
     
     Args:
         models_dir: Path to the Models directory
-        model_name: Name of the model (e.g., 'vocal_tts', 'vocal_hifigan')
-        model_path: Relative path to the model file
+        entries: Dict mapping model names (e.g., 'vocal_tts') to dicts with a
+            relative 'path' and an optional 'optimized_path'
+        providers: Execution providers to request, in priority order
+            (default: default_providers())
+        opt_level: ONNX Runtime graph optimization level for the unoptimized model
     """
     config_path = os.path.join(models_dir, 'config.json')
     
@@ -347,12 +838,23 @@ def update_model_config(models_dir, model_name, model_path):
     else:
         config = {}
     
-    config[model_name] = model_path
+    providers = providers or default_providers()
+    session_hints = config.setdefault('session_hints', {})
+    for model_name, entry in entries.items():
+        config[model_name] = entry['path']
+        hints = {'providers': providers, 'opt_level': opt_level}
+        if entry.get('optimized_path'):
+            hints['optimized_path'] = entry['optimized_path']
+            hints['opt_level'] = 0
+        session_hints[model_name] = hints
+        # Optimized paths used to be stored as separate top-level keys
+        config.pop(f"{model_name}_optimized", None)
     
     with open(config_path, 'w', encoding='utf-8') as f:
         json.dump(config, f, indent=2)
     
-    print(f"[OK] Updated config.json with {model_name}: {model_path}")
+    for model_name, entry in entries.items():
+        print(f"[OK] Updated config.json with {model_name}: {entry['path']}")
 
 
 def main():
@@ -405,9 +907,83 @@ def main():
         default=80,
         help='Output dimension (mel channels) (default: 80)'
     )
+    parser.add_argument(
+        '--prune',
+        type=float,
+        default=0.0,
+        metavar='AMOUNT',
+        help='Fraction of Linear weights to prune from a loaded .pth model, e.g. 0.3 (default: 0)'
+    )
+    parser.add_argument(
+        '--quantize',
+        type=str,
+        choices=['none', 'dynamic', 'static'],
+        default='none',
+        help='INT8 quantization applied after export; static calibrates HiFi-GAN activations (default: none)'
+    )
+    parser.add_argument(
+        '--dtype',
+        type=str,
+        choices=['fp32', 'fp16', 'bf16'],
+        default='fp32',
+        help='Exported weight precision; fp16 keeps FP32 inputs/outputs (default: fp32)'
+    )
+    shape_group = parser.add_mutually_exclusive_group()
+    shape_group.add_argument(
+        '--static-shapes',
+        dest='static_shapes',
+        action='store_true',
+        help='Export with fixed batch/time dimensions (default)'
+    )
+    shape_group.add_argument(
+        '--dynamic-shapes',
+        dest='static_shapes',
+        action='store_false',
+        help='Export with dynamic batch/time axes for variable-size inputs'
+    )
+    parser.set_defaults(static_shapes=True)
+    validate_group = parser.add_mutually_exclusive_group()
+    validate_group.add_argument(
+        '--validate',
+        dest='validate',
+        action='store_true',
+        default=None,
+        help='Run the ONNX checker on exported models (default for single conversions)'
+    )
+    validate_group.add_argument(
+        '--no-validate',
+        dest='validate',
+        action='store_false',
+        help='Skip the ONNX checker (default for --create-default)'
+    )
+    parser.add_argument(
+        '--export-batch',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Batch size of the traced dummy input (default: 8 with --dynamic-shapes, 1 otherwise)'
+    )
+    parser.add_argument(
+        '--time-frames',
+        type=int,
+        default=100,
+        help='Mel frames per HiFi-GAN call when exporting static shapes (default: 100)'
+    )
     
     args = parser.parse_args()
     
+    if args.dtype != 'fp32' and args.quantize != 'none':
+        parser.error("--dtype fp16/bf16 cannot be combined with --quantize")
+    
+    if args.export_batch is None:
+        # A static batch is fixed at runtime, so only trace larger batches when it can vary
+        args.export_batch = 1 if args.static_shapes else 8
+    
+    create_default = args.create_default or not args.input
+    if args.validate is None:
+        # Bulk default-model runs skip the extra load + check per model
+        args.validate = not create_default
+    
     print("=" * 60)
     print("MAEVN PTH to ONNX Converter")
     print("=" * 60)
@@ -416,10 +992,11 @@ def main():
         'input_dim': args.input_dim,
         'hidden_dim': args.hidden_dim,
         'output_dim': args.output_dim,
-        'mel_channels': args.output_dim
+        'mel_channels': args.output_dim,
+        'time_frames': args.time_frames
     }
     
-    if args.create_default or not args.input:
+    if create_default:
         # Create default models
         script_dir = os.path.dirname(os.path.abspath(__file__))
         output_dir = os.path.join(script_dir, args.output_dir)
@@ -427,15 +1004,28 @@ def main():
         print("\nCreating default vocal models for MAEVN pipeline...")
         
         # Create TTS model
-        tts_path = create_default_vocal_model(output_dir, 'tts')
+        tts_path = create_default_vocal_model(
+            output_dir, 'tts', args.quantize, args.static_shapes, args.time_frames, args.dtype,
+            args.export_batch, args.validate
+        )
         
         # Create HiFi-GAN model
-        hifigan_path = create_default_vocal_model(output_dir, 'hifigan')
+        hifigan_path = create_default_vocal_model(
+            output_dir, 'hifigan', args.quantize, args.static_shapes, args.time_frames, args.dtype,
+            args.export_batch, args.validate
+        )
         
         # Update config.json
         models_dir = os.path.dirname(output_dir)
-        update_model_config(models_dir, 'vocal_tts', 'vocals/vocals_tts.onnx')
-        update_model_config(models_dir, 'vocal_hifigan', 'vocals/vocals_hifigan.onnx')
+        config_entries = {}
+        for model_name, model_path in [('vocal_tts', 'vocals/vocals_tts.onnx'),
+                                       ('vocal_hifigan', 'vocals/vocals_hifigan.onnx')]:
+            entry = {'path': model_path}
+            optimized_path = optimized_model_path(model_path)
+            if os.path.exists(os.path.join(models_dir, optimized_path)):
+                entry['optimized_path'] = optimized_path
+            config_entries[model_name] = entry
+        update_model_config(models_dir, config_entries, default_providers(args.quantize, args.dtype))
         
         print("\n" + "=" * 60)
         print("Default vocal models created successfully!")
@@ -449,8 +1039,9 @@ def main():
             base = os.path.splitext(args.input)[0]
             args.output = f"{base}.onnx"
         
-        model = load_pth_model(args.input, args.model_type, config)
-        export_to_onnx(model, args.output, args.model_type, config)
+        model = load_pth_model(args.input, args.model_type, config, args.prune)
+        export_to_onnx(model, args.output, args.model_type, config, args.quantize,
+                       args.static_shapes, args.dtype, args.export_batch, args.validate)
         
         print("\n" + "=" * 60)
         print("Conversion complete!")
@@ -7,148 +7,225 @@ Generates lightweight ONNX models for instrument synthesis
 import torch
 import torch.nn as nn
 import torch.onnx
+import onnx
+import argparse
 import os
 import numpy as np
 import sys
 import io
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from torch._subclasses.fake_tensor import FakeTensorMode
+except ImportError:
+    FakeTensorMode = None
 
 # Configure UTF-8 encoding for stdout to prevent UnicodeEncodeError
 if not sys.stdout.encoding or sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-class SimpleDDSP808(nn.Module):
-    """Simple DDSP-inspired 808 bass generator"""
-    def __init__(self):
-        super().__init__()
-        self.fc1 = nn.Linear(128, 256)
-        self.fc2 = nn.Linear(256, 512)
-        self.fc3 = nn.Linear(512, 1024)
-        
-    def forward(self, x):
-        x = torch.relu(self.fc1(x))
-        x = torch.relu(self.fc2(x))
-        x = torch.tanh(self.fc3(x))
-        return x
+def make_mlp(dims):
+    """Build an MLP generator: Linear+ReLU hidden layers and a Tanh output"""
+    layers = []
+    for i, (in_dim, out_dim) in enumerate(zip(dims, dims[1:])):
+        layers.append(nn.Linear(in_dim, out_dim))
+        layers.append(nn.ReLU() if i < len(dims) - 2 else nn.Tanh())
+    return nn.Sequential(*layers)
 
-class SimpleHiHat(nn.Module):
-    """Simple hi-hat generator"""
-    def __init__(self):
-        super().__init__()
-        self.fc1 = nn.Linear(64, 128)
-        self.fc2 = nn.Linear(128, 256)
-        self.fc3 = nn.Linear(256, 512)
-        
-    def forward(self, x):
-        x = torch.relu(self.fc1(x))
-        x = torch.relu(self.fc2(x))
-        x = torch.tanh(self.fc3(x))
-        return x
+# Instrument generators: (name, layer dims, output path)
+GENERATORS = [
+    ("808 Bass", [128, 256, 512, 1024], "../Models/drums/808_ddsp.onnx"),
+    ("Hi-Hat", [64, 128, 256, 512], "../Models/drums/hihat_ddsp.onnx"),
+    ("Snare", [64, 128, 256, 512], "../Models/drums/snare_ddsp.onnx"),
+    ("Piano", [256, 512, 1024, 2048], "../Models/instruments/piano_ddsp.onnx"),
+    ("Synth", [128, 256, 512, 1024], "../Models/instruments/synth_fm.onnx"),
+]
 
-class SimpleSnare(nn.Module):
-    """Simple snare generator"""
-    def __init__(self):
-        super().__init__()
-        self.fc1 = nn.Linear(64, 128)
-        self.fc2 = nn.Linear(128, 256)
-        self.fc3 = nn.Linear(256, 512)
-        
-    def forward(self, x):
-        x = torch.relu(self.fc1(x))
-        x = torch.relu(self.fc2(x))
-        x = torch.tanh(self.fc3(x))
-        return x
+def quantize_dynamic_int8(fp32_path, output_path):
+    """Quantize ONNX model weights to INT8 with ONNX Runtime"""
+    # torch's quantized::linear_dynamic has no ONNX export, so quantize the graph
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+    
+    prep_path = os.path.splitext(fp32_path)[0] + '.prep.onnx'
+    quant_pre_process(fp32_path, prep_path)
+    quantize_dynamic(prep_path, output_path, weight_type=QuantType.QInt8)
 
-class SimplePiano(nn.Module):
-    """Simple piano generator"""
-    def __init__(self):
-        super().__init__()
-        self.fc1 = nn.Linear(256, 512)
-        self.fc2 = nn.Linear(512, 1024)
-        self.fc3 = nn.Linear(1024, 2048)
-        
-    def forward(self, x):
-        x = torch.relu(self.fc1(x))
-        x = torch.relu(self.fc2(x))
-        x = torch.tanh(self.fc3(x))
-        return x
+def save_onnx_model(onnx_model, output_path):
+    """Save an ONNX model with its weights in a <name>.onnx.data sidecar ORT can mmap"""
+    data_name = os.path.basename(output_path) + '.data'
+    data_path = os.path.join(os.path.dirname(output_path), data_name)
+    # onnx appends to an existing data file, so start from a clean one
+    if os.path.exists(data_path):
+        os.remove(data_path)
+    onnx.save_model(
+        onnx_model,
+        output_path,
+        save_as_external_data=True,
+        all_tensors_to_one_file=True,
+        location=data_name,
+        size_threshold=1024
+    )
 
-class SimpleSynth(nn.Module):
-    """Simple FM synth generator"""
-    def __init__(self):
-        super().__init__()
-        self.fc1 = nn.Linear(128, 256)
-        self.fc2 = nn.Linear(256, 512)
-        self.fc3 = nn.Linear(512, 1024)
-        
-    def forward(self, x):
-        x = torch.relu(self.fc1(x))
-        x = torch.relu(self.fc2(x))
-        x = torch.tanh(self.fc3(x))
-        return x
+def simplify_onnx_model(model_path, output_path):
+    """Fold constant subgraphs with onnx-simplifier, if installed"""
+    onnx_model = onnx.load(model_path)
+    try:
+        from onnxsim import simplify
+        simplified, ok = simplify(onnx_model)
+        if ok:
+            onnx_model = simplified
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"Warning: onnxsim simplification failed: {e}")
+    save_onnx_model(onnx_model, output_path)
 
-def export_model(model, dummy_input, output_path, model_name):
+def export_model(model, dummy_input, output_path, model_name, quantize='none', static_shapes=True,
+                 validate=False):
     """Export PyTorch model to ONNX format"""
     print(f"Exporting {model_name} to {output_path}")
     
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    # Export to ONNX
-    torch.onnx.export(
-        model,
-        dummy_input,
-        output_path,
-        export_params=True,
-        opset_version=18,
-        do_constant_folding=True,
-        input_names=['input'],
-        output_names=['output'],
-        dynamic_axes={
-            'input': {0: 'batch_size'},
-            'output': {0: 'batch_size'}
-        }
-    )
+    # Export to ONNX via a temporary file so the output is self-contained
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export_path = os.path.join(tmp_dir, 'fp32.onnx')
+        
+        # Trace without autograd bookkeeping (no grad graph or version counters)
+        with torch.inference_mode():
+            torch.onnx.export(
+                model,
+                dummy_input,
+                export_path,
+                export_params=True,
+                opset_version=18,
+                do_constant_folding=True,
+                input_names=['input'],
+                output_names=['output'],
+                # Fixed shapes let ONNX Runtime fully constant-fold the graph
+                dynamic_axes=None if static_shapes else {
+                    'input': {0: 'batch_size'},
+                    'output': {0: 'batch_size'}
+                }
+            )
+        
+        if quantize == 'dynamic':
+            graph_path = os.path.join(tmp_dir, 'graph.onnx')
+            quant_path = os.path.join(tmp_dir, 'int8.onnx')
+            simplify_onnx_model(export_path, graph_path)
+            quantize_dynamic_int8(graph_path, quant_path)
+            save_onnx_model(onnx.load(quant_path), output_path)
+        else:
+            simplify_onnx_model(export_path, output_path)
+    
+    if validate:
+        onnx.checker.check_model(output_path)
     
     print(f"[OK] {model_name} exported successfully")
 
+def _export_task(task):
+    """Build and export one generator in a worker process"""
+    name, dims, output_path, batch_size, quantize, static_shapes, validate = task
+    
+    # One thread per worker; the pool provides the parallelism
+    torch.set_num_threads(1)
+    torch.set_grad_enabled(False)
+    
+    model = make_mlp(dims)
+    model.eval()
+    
+    # Tracing only needs shapes, so use a storage-free FakeTensor dummy
+    # (torch.export rejects plain meta tensors next to CPU weights)
+    if FakeTensorMode is not None:
+        with FakeTensorMode(allow_non_fake_inputs=True):
+            dummy_input = torch.empty(batch_size, dims[0])
+        try:
+            export_model(model, dummy_input, output_path, name, quantize, static_shapes, validate)
+            return
+        except Exception as e:
+            print(f"Note: storage-free tracing failed for {name} ({type(e).__name__}); retrying with a CPU tensor")
+    
+    dummy_input = torch.empty(batch_size, dims[0])
+    export_model(model, dummy_input, output_path, name, quantize, static_shapes, validate)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Export MAEVN instrument models to ONNX')
+    parser.add_argument(
+        '--quantize',
+        type=str,
+        choices=['none', 'dynamic'],
+        default='none',
+        help='Weight quantization applied after export (default: none)'
+    )
+    shape_group = parser.add_mutually_exclusive_group()
+    shape_group.add_argument(
+        '--static-shapes',
+        dest='static_shapes',
+        action='store_true',
+        help='Export with a fixed batch dimension (default)'
+    )
+    shape_group.add_argument(
+        '--dynamic-shapes',
+        dest='static_shapes',
+        action='store_false',
+        help='Export with a dynamic batch axis'
+    )
+    parser.set_defaults(static_shapes=True)
+    parser.add_argument(
+        '--export-batch',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Batch size of the traced dummy input (default: 8 with --dynamic-shapes, 1 otherwise)'
+    )
+    parser.add_argument(
+        '--validate',
+        action='store_true',
+        help='Run the ONNX checker on each exported model'
+    )
+    args = parser.parse_args()
+    
+    if args.export_batch is None:
+        # A static batch is fixed at runtime, so only trace larger batches when it can vary
+        args.export_batch = 1 if args.static_shapes else 8
+    
+    return args
+
 def main():
     """Main export function"""
+    args = parse_args()
+    
     print("=" * 60)
     print("MAEVN ONNX Model Export")
     print("=" * 60)
     
-    # Set to evaluation mode
-    torch.set_grad_enabled(False)
+    # Export each unique architecture once; generators with the same
+    # shape share the exported graph
+    exported = {}
+    tasks = []
+    shared = []
+    for name, dims, output_path in GENERATORS:
+        key = tuple(dims)
+        if key in exported:
+            shared.append((name, output_path, exported[key]))
+            continue
+        exported[key] = (name, output_path)
+        tasks.append((name, dims, output_path, args.export_batch, args.quantize, args.static_shapes,
+                      args.validate))
+    
+    # Exports are independent and single-threaded in tracing, so run them concurrently
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        list(executor.map(_export_task, tasks))
     
-    # Export 808 model
-    model_808 = SimpleDDSP808()
-    model_808.eval()
-    dummy_808 = torch.randn(1, 128)
-    export_model(model_808, dummy_808, "../Models/drums/808_ddsp.onnx", "808 Bass")
-    
-    # Export hi-hat model
-    model_hihat = SimpleHiHat()
-    model_hihat.eval()
-    dummy_hihat = torch.randn(1, 64)
-    export_model(model_hihat, dummy_hihat, "../Models/drums/hihat_ddsp.onnx", "Hi-Hat")
-    
-    # Export snare model
-    model_snare = SimpleSnare()
-    model_snare.eval()
-    dummy_snare = torch.randn(1, 64)
-    export_model(model_snare, dummy_snare, "../Models/drums/snare_ddsp.onnx", "Snare")
-    
-    # Export piano model
-    model_piano = SimplePiano()
-    model_piano.eval()
-    dummy_piano = torch.randn(1, 256)
-    export_model(model_piano, dummy_piano, "../Models/instruments/piano_ddsp.onnx", "Piano")
-    
-    # Export synth model
-    model_synth = SimpleSynth()
-    model_synth.eval()
-    dummy_synth = torch.randn(1, 128)
-    export_model(model_synth, dummy_synth, "../Models/instruments/synth_fm.onnx", "Synth")
+    for name, output_path, (shared_name, shared_path) in shared:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Re-save rather than copy so the graph points at its own weights file
+        save_onnx_model(onnx.load(shared_path), output_path)
+        print(f"[OK] {name} shares the {shared_name} graph: {output_path}")
     
     print("=" * 60)
     print("All models exported successfully!")
@@ -16,6 +16,9 @@ This script produces a real, playable audio file with:
 Output: A 59-second (00:59) stereo WAV file at 44.1kHz, 16-bit
 """
 
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from scipy import signal
 from scipy.io import wavfile
@@ -23,6 +26,12 @@ import os
 import sys
 import io
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure UTF-8 encoding for stdout to prevent UnicodeEncodeError
 if not sys.stdout.encoding or sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -39,14 +48,22 @@ NUM_SAMPLES = int(SAMPLE_RATE * DURATION)
 ROOT_NOTE = 36  # C2 for bass
 SCALE_NOTES = [0, 3, 5, 7, 10, 12]  # Minor pentatonic scale offsets
 
+# Shared noise source (PCG64); seeded so renders are reproducible. Rendered
+# jobs each swap in their own child stream of the same seed (see render_events)
+_SEED = 42
+_RNG = np.random.default_rng(_SEED)
+
+# Frequency in Hz of every MIDI note number
+_MIDI_FREQ = 440.0 * (2.0 ** ((np.arange(128, dtype=np.float64) - 69) / 12.0))
+
 def midi_to_freq(midi_note):
-    """Convert MIDI note number to frequency in Hz."""
-    return 440.0 * (2.0 ** ((midi_note - 69) / 12.0))
+    """Convert MIDI note number(s) to frequency in Hz (table lookup; accepts arrays)."""
+    return _MIDI_FREQ[midi_note]
 
-def generate_envelope(attack, decay, sustain, release, duration, sample_rate=SAMPLE_RATE):
-    """Generate ADSR envelope."""
+@functools.lru_cache(maxsize=256)
+def _render_envelope(attack, decay, sustain, release, duration, sample_rate):
+    """Render a read-only ADSR envelope."""
     num_samples = int(duration * sample_rate)
-    envelope = np.zeros(num_samples)
     
     attack_samples = int(attack * sample_rate)
     decay_samples = int(decay * sample_rate)
@@ -57,53 +74,81 @@ def generate_envelope(attack, decay, sustain, release, duration, sample_rate=SAM
         sustain_samples = 0
         release_samples = num_samples - attack_samples - decay_samples
     
-    # Attack
-    if attack_samples > 0:
-        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+    # Stages as (start, length, from, to); together they cover every sample
+    # exactly once, so the buffer needs no zero-fill
+    decay_end = attack_samples + decay_samples
+    release_start = num_samples - release_samples
+    stages = [
+        (0, attack_samples, 0.0, 1.0),
+        (attack_samples, min(decay_samples, num_samples - attack_samples), 1.0, sustain),
+        (decay_end, min(decay_end + sustain_samples, num_samples) - decay_end, sustain, sustain),
+    ]
+    if 0 <= release_start < num_samples:
+        stages.append((release_start, release_samples, sustain, 0.0))
     
-    # Decay
-    start = attack_samples
-    end = start + decay_samples
-    if end > start:
-        envelope[start:min(end, num_samples)] = np.linspace(1, sustain, min(decay_samples, num_samples - start))
+    envelope = np.empty(num_samples, dtype=np.float32)
+    for start, length, begin, end in stages:
+        if length <= 0:
+            continue
+        if begin == end:
+            envelope[start:start + length] = begin
+        else:
+            envelope[start:start + length] = np.linspace(begin, end, length)
     
-    # Sustain
-    start = attack_samples + decay_samples
-    end = start + sustain_samples
-    if end > start:
-        envelope[start:min(end, num_samples)] = sustain
+    # Shared between callers through the cache, so guard against in-place edits
+    envelope.setflags(write=False)
+    return envelope
+
+def generate_envelope(attack, decay, sustain, release, duration, sample_rate=SAMPLE_RATE):
+    """Generate ADSR envelope (cached by parameters; the result is read-only)."""
+    return _render_envelope(attack, decay, sustain, release, duration, sample_rate)
+
+def _synth_808_numpy(freq_start, freq_end, num_samples, sample_rate):
+    """Render the saturated 808 oscillator, gliding linearly between frequencies."""
+    freq_step = (freq_end - freq_start) / (num_samples - 1) if num_samples > 1 else 0.0
+    i = np.arange(num_samples, dtype=np.float64)
+    
+    # Generate sub-bass with harmonics; the running phase sum of the linear
+    # glide in closed form, without materializing the frequency ramp
+    phase = (2 * np.pi / sample_rate) * (i + 1) * (freq_start + freq_step * 0.5 * i)
+    wave = np.sin(phase)
     
-    # Release
-    start = num_samples - release_samples
-    if start >= 0 and start < num_samples:
-        envelope[start:] = np.linspace(sustain, 0, len(envelope[start:]))
+    # Add some harmonics for punch
+    wave += 0.3 * np.sin(2 * phase)
+    wave += 0.1 * np.sin(3 * phase)
     
-    return envelope
+    # Apply saturation for warmth
+    return (np.tanh(wave * 2.0) * 0.8).astype(np.float32)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _synth_808_core(freq_start, freq_end, num_samples, sample_rate):
+        """Render the saturated 808 oscillator in one fused pass (no temporaries)."""
+        wave = np.empty(num_samples, dtype=np.float32)
+        freq_step = (freq_end - freq_start) / (num_samples - 1) if num_samples > 1 else 0.0
+        omega = 2 * np.pi / sample_rate
+        for i in range(num_samples):
+            # Closed form of the running phase sum, so iterations are independent
+            phase = omega * (freq_start * (i + 1) + freq_step * 0.5 * i * (i + 1))
+            s1 = np.sin(phase)
+            c1 = np.cos(phase)
+            # sin(2x) and sin(3x) from sin(x) and cos(x)
+            w = s1 + 0.3 * (2 * s1 * c1) + 0.1 * (s1 * (3 - 4 * s1 * s1))
+            wave[i] = np.tanh(w * 2.0) * 0.8
+        return wave
+else:
+    _synth_808_core = _synth_808_numpy
 
 def generate_808_bass(start_sample, duration_beats, root_note, glide_to=None):
     """Generate 808 sub-bass with optional glide."""
     duration = duration_beats * BEAT_DURATION
     num_samples = int(duration * SAMPLE_RATE)
-    t = np.linspace(0, duration, num_samples)
     
     # Base frequency with glide
     freq_start = midi_to_freq(root_note)
-    if glide_to is not None:
-        freq_end = midi_to_freq(glide_to)
-        freq = np.linspace(freq_start, freq_end, num_samples)
-    else:
-        freq = np.full(num_samples, freq_start)
+    freq_end = midi_to_freq(glide_to) if glide_to is not None else freq_start
     
-    # Generate sub-bass with harmonics
-    phase = np.cumsum(2 * np.pi * freq / SAMPLE_RATE)
-    wave = np.sin(phase)
-    
-    # Add some harmonics for punch
-    wave += 0.3 * np.sin(2 * phase)
-    wave += 0.1 * np.sin(3 * phase)
-    
-    # Apply saturation for warmth
-    wave = np.tanh(wave * 2.0) * 0.8
+    wave = _synth_808_core(freq_start, freq_end, num_samples, SAMPLE_RATE)
     
     # Apply envelope
     envelope = generate_envelope(0.005, 0.1, 0.6, duration * 0.5, duration)
@@ -111,8 +156,8 @@ def generate_808_bass(start_sample, duration_beats, root_note, glide_to=None):
     
     return start_sample, wave * 0.5  # Reduce level for mixing
 
-def generate_hihat(start_sample, closed=True, velocity=0.8):
-    """Generate hi-hat using filtered noise."""
+def _render_hihats(closed=True, count=1):
+    """Render `count` unit-velocity hi-hats from filtered noise, one per row."""
     if closed:
         duration = 0.05
         cutoff = 8000
@@ -122,24 +167,31 @@ def generate_hihat(start_sample, closed=True, velocity=0.8):
     
     num_samples = int(duration * SAMPLE_RATE)
     
-    # White noise
-    noise = np.random.randn(num_samples)
+    # White noise, one realization per row
+    noise = _RNG.standard_normal((count, num_samples), dtype=np.float32)
     
-    # High-pass filter
+    # High-pass filter, run over every row in one call
     nyquist = SAMPLE_RATE / 2
     high = cutoff / nyquist
-    b, a = signal.butter(2, high, btype='high')
-    filtered = signal.filtfilt(b, a, noise)
+    sos = signal.butter(2, high, btype='high', output='sos')
+    filtered = signal.sosfilt(sos, noise, axis=-1)
     
     # Envelope
     envelope = np.exp(-np.linspace(0, 8 if closed else 4, num_samples))
     
-    wave = filtered * envelope * velocity * 0.15
-    
-    return start_sample, wave
+    return (filtered * envelope).astype(np.float32)
 
-def generate_snare(start_sample, velocity=0.9):
-    """Generate snare/clap with body and noise."""
+# Hi-hats only differ by velocity, so render a set of noise variants once and
+# scale them per hit instead of filtering fresh noise for every event
+HIHAT_VARIANTS = 16
+_HIHAT_CLOSED = _render_hihats(closed=True, count=HIHAT_VARIANTS)
+_HIHAT_OPEN = _render_hihats(closed=False, count=HIHAT_VARIANTS)
+
+# Snare noise bandpass, designed once rather than per hit
+_SNARE_SOS = signal.butter(2, [0.05, 0.4], btype='band', output='sos')
+
+def _render_snares(count=1):
+    """Render `count` unit-velocity snare/claps with body and noise, one per row."""
     duration = 0.25
     num_samples = int(duration * SAMPLE_RATE)
     t = np.linspace(0, duration, num_samples)
@@ -150,35 +202,51 @@ def generate_snare(start_sample, velocity=0.9):
     body_envelope = np.exp(-t * 30)
     body *= body_envelope
     
-    # Noise component
-    noise = np.random.randn(num_samples)
-    b, a = signal.butter(2, [0.05, 0.4], btype='band')
-    noise = signal.filtfilt(b, a, noise)
+    # Noise component, filtered for every row in one call
+    noise = _RNG.standard_normal((count, num_samples), dtype=np.float32)
+    noise = signal.sosfilt(_SNARE_SOS, noise, axis=-1)
     noise_envelope = np.exp(-t * 15)
     noise *= noise_envelope
     
-    wave = (body * 0.4 + noise * 0.6) * velocity * 0.35
+    return (body * 0.4 + noise * 0.6).astype(np.float32)
+
+SNARE_VARIANTS = 4
+_SNARE_TEMPLATES = _render_snares(count=SNARE_VARIANTS)
+_snare_counter = itertools.count()
+
+def generate_snare(start_sample, velocity=0.9):
+    """Generate snare/clap from a pre-rendered template."""
+    template = _SNARE_TEMPLATES[next(_snare_counter) % SNARE_VARIANTS]
+    wave = template * (velocity * 0.35)
     
     return start_sample, wave
 
+def _piano_spectrum(freqs, num_samples, dt):
+    """Sum four harmonics per note by placing them as bins of one inverse FFT."""
+    spectrum = np.zeros(num_samples // 2 + 1, dtype=np.complex128)
+    
+    for freq in freqs:
+        # Snap the fundamental to the nearest bin (under 3 cents for these
+        # chords) and keep the harmonics on exact multiples of it
+        fundamental_bin = int(round(freq * num_samples * dt))
+        # Rich harmonic content
+        for harmonic, amp in enumerate([1.0, 0.5, 0.25, 0.125], start=1):
+            k = fundamental_bin * harmonic
+            if 0 < k < len(spectrum):
+                # A -j coefficient of amp * N / 2 is amp * sin(2 pi k n / N)
+                spectrum[k] -= 1j * amp * num_samples / 2
+    
+    return np.fft.irfft(spectrum, n=num_samples).astype(np.float32)
+
 def generate_piano_chord(start_sample, midi_notes, duration_beats):
     """Generate piano chord using additive synthesis."""
     duration = duration_beats * BEAT_DURATION
     num_samples = int(duration * SAMPLE_RATE)
-    t = np.linspace(0, duration, num_samples)
-    
-    wave = np.zeros(num_samples)
     
-    for note in midi_notes:
-        freq = midi_to_freq(note)
-        
-        # Rich harmonic content
-        note_wave = np.sin(2 * np.pi * freq * t)
-        note_wave += 0.5 * np.sin(2 * np.pi * freq * 2 * t)
-        note_wave += 0.25 * np.sin(2 * np.pi * freq * 3 * t)
-        note_wave += 0.125 * np.sin(2 * np.pi * freq * 4 * t)
-        
-        wave += note_wave
+    # Same time grid as np.linspace(0, duration, num_samples)
+    dt = duration / (num_samples - 1) if num_samples > 1 else 0.0
+    freqs = midi_to_freq(np.asarray(midi_notes))
+    wave = _piano_spectrum(freqs, num_samples, dt)
     
     # Normalize
     wave /= len(midi_notes)
@@ -189,29 +257,53 @@ def generate_piano_chord(start_sample, midi_notes, duration_beats):
     
     return start_sample, wave * 0.2
 
-def generate_synth_pad(start_sample, midi_note, duration_beats):
-    """Generate FM synth pad."""
-    duration = duration_beats * BEAT_DURATION
-    num_samples = int(duration * SAMPLE_RATE)
-    t = np.linspace(0, duration, num_samples)
-    
-    carrier_freq = midi_to_freq(midi_note)
+def _fm_pad_numpy(carrier_freq, num_samples, dt, detune, mod_index):
+    """Render three detuned FM voices with a slow LFO, sampled at times i * dt."""
+    t = np.arange(num_samples) * dt
     modulator_freq = carrier_freq * 2.0
     
     # FM synthesis with modulation index
-    mod_index = 2.0
     modulator = np.sin(2 * np.pi * modulator_freq * t) * mod_index
     wave = np.sin(2 * np.pi * carrier_freq * t + modulator)
     
     # Add detuned layer
-    detune = 0.02
     wave2 = np.sin(2 * np.pi * carrier_freq * (1 + detune) * t + modulator)
     wave3 = np.sin(2 * np.pi * carrier_freq * (1 - detune) * t + modulator)
     wave = (wave + wave2 + wave3) / 3
     
     # Apply slow LFO for movement
     lfo = 0.5 + 0.5 * np.sin(2 * np.pi * 0.5 * t)
-    wave *= lfo
+    return (wave * lfo).astype(np.float32)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _fm_pad_core(carrier_freq, num_samples, dt, detune, mod_index):
+        """Render three detuned FM voices with a slow LFO in one fused pass."""
+        wave = np.empty(num_samples, dtype=np.float32)
+        omega_c = 2 * np.pi * carrier_freq * dt
+        omega_m = 2 * omega_c
+        omega_lfo = 2 * np.pi * 0.5 * dt
+        for i in range(num_samples):
+            carrier = omega_c * i
+            modulator = np.sin(omega_m * i) * mod_index
+            # sin(x + y) + sin(x - y) = 2 sin(x) cos(y) folds the detuned pair
+            # into the centre voice
+            voices = np.sin(carrier + modulator) * (1 + 2 * np.cos(carrier * detune))
+            lfo = 0.5 + 0.5 * np.sin(omega_lfo * i)
+            wave[i] = voices / 3 * lfo
+        return wave
+else:
+    _fm_pad_core = _fm_pad_numpy
+
+def generate_synth_pad(start_sample, midi_note, duration_beats):
+    """Generate FM synth pad."""
+    duration = duration_beats * BEAT_DURATION
+    num_samples = int(duration * SAMPLE_RATE)
+    
+    # Same time grid as np.linspace(0, duration, num_samples)
+    dt = duration / (num_samples - 1) if num_samples > 1 else 0.0
+    carrier_freq = midi_to_freq(midi_note)
+    wave = _fm_pad_core(carrier_freq, num_samples, dt, detune=0.02, mod_index=2.0)
     
     # Apply envelope
     envelope = generate_envelope(0.3, 0.2, 0.7, 0.8, duration)
@@ -219,54 +311,66 @@ def generate_synth_pad(start_sample, midi_note, duration_beats):
     
     return start_sample, wave * 0.12
 
+# Formant frequencies for different vowels (simplified)
+FORMANTS = {
+    'a': [730, 1090, 2440],
+    'e': [530, 1840, 2480],
+    'i': [270, 2290, 3010],
+    'o': [570, 840, 2410],
+    'u': [440, 1020, 2240],
+}
+
+def _formant_bank(formant_freqs):
+    """Design one 200 Hz wide bandpass (as second-order sections) per formant."""
+    nyquist = SAMPLE_RATE / 2
+    bank = []
+    for formant_freq in formant_freqs:
+        low = max(0.01, (formant_freq - 100) / nyquist)
+        high = min(0.99, (formant_freq + 100) / nyquist)
+        if low < high:
+            bank.append(signal.butter(2, [low, high], btype='band', output='sos'))
+    return bank
+
+# Formant filter banks, designed once instead of per vocal segment
+VOWEL_SOS = {vowel: _formant_bank(freqs) for vowel, freqs in FORMANTS.items()}
+# Unit-step steady-state filter states, scaled per segment so each vowel starts
+# settled instead of ringing in from zero
+VOWEL_ZI = {vowel: [signal.sosfilt_zi(sos) for sos in bank] for vowel, bank in VOWEL_SOS.items()}
+
 def generate_vocal_formant(start_sample, text, duration_beats, pitch_midi):
     """Generate synthesized vocal using formant synthesis."""
     duration = duration_beats * BEAT_DURATION
     num_samples = int(duration * SAMPLE_RATE)
     t = np.linspace(0, duration, num_samples)
     
-    # Formant frequencies for different vowels (simplified)
-    formants = {
-        'a': [730, 1090, 2440],
-        'e': [530, 1840, 2480],
-        'i': [270, 2290, 3010],
-        'o': [570, 840, 2410],
-        'u': [440, 1020, 2240],
-    }
-    
     # Generate glottal pulse train (carrier)
     f0 = midi_to_freq(pitch_midi)
     phase = 2 * np.pi * f0 * t
     
     # Glottal source with harmonics
-    source = np.zeros(num_samples)
+    source = np.zeros(num_samples, dtype=np.float32)
     for h in range(1, 15):
         amp = 1.0 / (h ** 0.8)
         source += amp * np.sin(h * phase)
     
     # Apply formant filtering
-    wave = np.zeros(num_samples)
+    wave = np.zeros(num_samples, dtype=np.float32)
     vowel_sequence = ['o', 'a', 'i', 'e', 'u']
     
     for i, vowel in enumerate(vowel_sequence):
-        if vowel in formants:
+        if vowel in VOWEL_SOS:
             start_idx = i * num_samples // len(vowel_sequence)
             end_idx = (i + 1) * num_samples // len(vowel_sequence)
-            segment = source[start_idx:end_idx].copy()
+            segment = source[start_idx:end_idx]
             
-            # Apply formant filters
-            for formant_freq in formants[vowel]:
-                nyquist = SAMPLE_RATE / 2
-                low = max(0.01, (formant_freq - 100) / nyquist)
-                high = min(0.99, (formant_freq + 100) / nyquist)
-                if low < high:
-                    b, a = signal.butter(2, [low, high], btype='band')
-                    filtered = signal.filtfilt(b, a, segment)
-                    wave[start_idx:end_idx] += filtered * 0.3
+            # Apply formant filters (parallel bands, summed)
+            for sos, zi in zip(VOWEL_SOS[vowel], VOWEL_ZI[vowel]):
+                filtered, _ = signal.sosfilt(sos, segment, zi=zi * segment[0])
+                wave[start_idx:end_idx] += filtered * 0.3
     
     # Add some noise for consonants
-    noise = np.random.randn(num_samples) * 0.02
-    noise_env = np.zeros(num_samples)
+    noise = _RNG.standard_normal(num_samples, dtype=np.float32) * 0.02
+    noise_env = np.zeros(num_samples, dtype=np.float32)
     for i in range(0, num_samples, num_samples // 5):
         end = min(i + 1000, num_samples)
         noise_env[i:end] = np.linspace(1, 0, end - i)
@@ -278,77 +382,140 @@ def generate_vocal_formant(start_sample, text, duration_beats, pitch_midi):
     
     return start_sample, wave * 0.35
 
+# Reverb delay taps (seconds, gain)
+REVERB_TAPS = [(0.023, 0.6), (0.041, 0.5), (0.067, 0.4), (0.089, 0.3), (0.113, 0.2)]
+
 def apply_reverb(audio, decay=0.3, room_size=0.4):
-    """Apply simple reverb effect."""
-    num_samples = len(audio)
-    reverb_length = num_samples + int(SAMPLE_RATE * 1.5)
-    reverb = np.zeros(reverb_length)
-    reverb[:num_samples] = audio
-    
-    # Multiple delay taps
-    delays = [int(SAMPLE_RATE * d) for d in [0.023, 0.041, 0.067, 0.089, 0.113]]
-    gains = [0.6, 0.5, 0.4, 0.3, 0.2]
-    
-    for delay, gain in zip(delays, gains):
-        # Ensure we don't exceed buffer bounds
-        end_idx = min(delay + num_samples, reverb_length)
-        samples_to_add = end_idx - delay
-        if samples_to_add > 0:
-            reverb[delay:end_idx] += audio[:samples_to_add] * gain * decay * room_size
-    
-    return reverb[:num_samples]
-
-def apply_compression(audio, threshold=-12, ratio=4):
-    """Apply simple compression."""
-    threshold_linear = 10 ** (threshold / 20)
-    
-    compressed = audio.copy()
-    above_threshold = np.abs(audio) > threshold_linear
-    
-    if np.any(above_threshold):
-        sign = np.sign(audio[above_threshold])
-        compressed[above_threshold] = sign * (
-            threshold_linear + (np.abs(audio[above_threshold]) - threshold_linear) / ratio
-        )
-    
-    return compressed
+    """Apply simple reverb effect along the last axis (mono or (channels, N))."""
+    num_samples = audio.shape[-1]
+    reverb = audio.copy()
+    
+    # Multiple delay taps; the tail past the input is discarded, so each tap
+    # adds straight into the output copy
+    for delay_time, gain in REVERB_TAPS:
+        delay = int(SAMPLE_RATE * delay_time)
+        if delay < num_samples:
+            reverb[..., delay:] += audio[..., :num_samples - delay] * (gain * decay * room_size)
+    
+    return reverb
+
+def _dynamics_numpy(audio, threshold_linear, ratio, ceiling_linear):
+    """Compress above threshold_linear, then clip to +/- ceiling_linear."""
+    magnitude = np.abs(audio)
+    compressed = threshold_linear + np.maximum(magnitude - threshold_linear, 0) / ratio
+    magnitude = np.minimum(np.minimum(magnitude, compressed), ceiling_linear)
+    return np.copysign(magnitude, audio)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _dynamics_core(audio, threshold_linear, ratio, ceiling_linear):
+        """Compress and clip in one streaming pass over the samples."""
+        flat = audio.ravel()
+        out = np.empty_like(flat)
+        for i in range(flat.size):
+            x = flat[i]
+            magnitude = abs(x)
+            if magnitude > threshold_linear:
+                magnitude = threshold_linear + (magnitude - threshold_linear) / ratio
+            if magnitude > ceiling_linear:
+                magnitude = ceiling_linear
+            out[i] = magnitude if x >= 0 else -magnitude
+        return out.reshape(audio.shape)
+else:
+    _dynamics_core = _dynamics_numpy
 
-def apply_limiter(audio, ceiling=-0.1):
-    """Apply brick-wall limiter."""
+def apply_dynamics(audio, threshold=-12, ratio=4, ceiling=-0.1):
+    """Apply compression followed by the brick-wall limiter in a single pass."""
+    threshold_linear = 10 ** (threshold / 20)
     ceiling_linear = 10 ** (ceiling / 20)
-    return np.clip(audio, -ceiling_linear, ceiling_linear)
+    return _dynamics_core(np.ascontiguousarray(audio), threshold_linear, ratio, ceiling_linear)
+
+def _render_event(job):
+    """Run one (generator, args, seed) job on its own noise stream; module-level so worker processes can unpickle it."""
+    global _RNG
+    generator, args, seed = job
+    shared_rng, _RNG = _RNG, np.random.default_rng(seed)
+    try:
+        return generator(*args)
+    finally:
+        _RNG = shared_rng
+
+def render_events(jobs):
+    """Render (generator, args) jobs in order, spread over worker processes when several CPUs are available."""
+    # Every job draws from its own child of the fixed seed, so the output is
+    # the same whether it renders serially or on any worker
+    seeds = np.random.SeedSequence(_SEED).spawn(len(jobs))
+    jobs = [(generator, args, seed) for (generator, args), seed in zip(jobs, seeds)]
+    
+    workers = min(os.cpu_count() or 1, len(jobs))
+    if workers < 2:
+        return [_render_event(job) for job in jobs]
+    
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_event, jobs, chunksize=chunksize))
 
 def mix_to_stereo(audio_events, pan_positions):
     """Mix mono audio events to stereo with panning."""
-    stereo = np.zeros((2, NUM_SAMPLES))
-    
-    for (start, wave), pan in zip(audio_events, pan_positions):
-        # Handle negative start positions
-        wave_start = 0
-        if start < 0:
-            wave_start = -start
-            start = 0
-        
-        # Skip if start is beyond the buffer
-        if start >= NUM_SAMPLES:
-            continue
-        
-        end = min(start + len(wave) - wave_start, NUM_SAMPLES)
-        actual_len = end - start
-        
-        # Skip if nothing to add
-        if actual_len <= 0:
-            continue
-        
-        # Calculate panning gains
-        left_gain = np.sqrt(0.5 * (1 - pan))
-        right_gain = np.sqrt(0.5 * (1 + pan))
-        
-        stereo[0, start:end] += wave[wave_start:wave_start+actual_len] * left_gain
-        stereo[1, start:end] += wave[wave_start:wave_start+actual_len] * right_gain
+    stereo = np.zeros((2, NUM_SAMPLES), dtype=np.float32)
+    if not audio_events:
+        return stereo
+    
+    # Compute every event's placement and gains as parallel arrays up front,
+    # leaving one slice-add per channel per event in the loop
+    starts = np.array([start for start, _ in audio_events], dtype=np.int64)
+    wave_lengths = np.array([len(wave) for _, wave in audio_events], dtype=np.int64)
+    
+    # Handle negative start positions
+    wave_starts = np.maximum(-starts, 0)
+    starts = np.maximum(starts, 0)
+    
+    # Clip to the buffer; events starting beyond it get zero length
+    ends = np.minimum(starts + wave_lengths - wave_starts, NUM_SAMPLES)
+    lengths = ends - starts
+    
+    # Calculate panning gains
+    pans = np.asarray(pan_positions, dtype=np.float32)
+    left_gains = np.sqrt(0.5 * (1 - pans))
+    right_gains = np.sqrt(0.5 * (1 + pans))
+    
+    for k in np.flatnonzero(lengths > 0).tolist():
+        wave = audio_events[k][1]
+        segment = wave[wave_starts[k]:wave_starts[k] + lengths[k]]
+        stereo[0, starts[k]:ends[k]] += segment * left_gains[k]
+        stereo[1, starts[k]:ends[k]] += segment * right_gains[k]
     
     return stereo
 
+def _scatter_numpy(out, starts, templates, variants, gains):
+    """Add templates[variants[k]] * gains[k] at each starts[k], clipped to the buffer."""
+    for start, variant, gain in zip(starts.tolist(), variants.tolist(), gains):
+        segment = templates[variant][:len(out) - start]
+        out[start:start + len(segment)] += segment * gain
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _scatter_core(out, starts, templates, variants, gains):
+        """Add every scaled template hit into the buffer in one compiled loop."""
+        template_length = templates.shape[1]
+        for k in range(starts.size):
+            start = starts[k]
+            length = min(template_length, out.size - start)
+            template = templates[variants[k]]
+            gain = gains[k]
+            for j in range(length):
+                out[start + j] += template[j] * gain
+else:
+    _scatter_core = _scatter_numpy
+
+def add_template_hits(stereo, starts, templates, variants, gains, pan):
+    """Add pre-rendered template hits (rows of `templates`) to the stereo bus at one pan position."""
+    left_gain = np.sqrt(0.5 * (1 - pan))
+    right_gain = np.sqrt(0.5 * (1 + pan))
+    for channel, pan_gain in ((0, left_gain), (1, right_gain)):
+        _scatter_core(stereo[channel], starts, templates, variants,
+                      (gains * pan_gain).astype(np.float32))
+
 def generate_song():
     """Generate a complete 60-second song with all instruments."""
     print("=" * 60)
@@ -362,6 +529,11 @@ def generate_song():
     audio_events = []
     pan_positions = []
     
+    # Tonal parts are queued as (generator, args) jobs and rendered together
+    # before mixing; the template-based drums are cheap and stay inline
+    jobs = []
+    job_pans = []
+    
     # Calculate total beats
     total_beats = int(DURATION * BPM / 60)
     
@@ -381,23 +553,27 @@ def generate_song():
     # ========================================
     print("  - Generating hi-hats...")
     hihat_pattern = [1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0]  # 16th notes
-    for beat in range(INTRO_END // 2, total_beats):  # Start after intro
-        for i, hit in enumerate(hihat_pattern):
-            if hit:
-                sample = int((beat + i * 0.25) * SAMPLES_PER_BEAT)
-                if sample < NUM_SAMPLES:
-                    velocity = 0.6 + 0.3 * (i % 4 == 0)  # Accent on beats
-                    event = generate_hihat(sample, closed=True, velocity=velocity)
-                    audio_events.append(event)
-                    pan_positions.append(-0.2)  # Slight left pan
-        
-        # Add open hi-hats on off-beats
-        if beat % 4 == 2:  # Every other beat
-            sample = int(beat * SAMPLES_PER_BEAT)
-            if sample < NUM_SAMPLES:
-                event = generate_hihat(sample, closed=False, velocity=0.5)
-                audio_events.append(event)
-                pan_positions.append(0.3)  # Slight right pan
+    # Every hit replays a template, so schedule them all as arrays and add them
+    # to the bus after mixing instead of going through audio_events
+    hihat_beats = np.arange(INTRO_END // 2, total_beats)  # Start after intro
+    steps = np.flatnonzero(hihat_pattern)
+    closed_starts = ((hihat_beats[:, None] + steps * 0.25) * SAMPLES_PER_BEAT).astype(np.int64).ravel()
+    closed_velocities = np.tile(0.6 + 0.3 * (steps % 4 == 0), len(hihat_beats))  # Accent on beats
+    # Cycle through the variants in beat order so hits stacked on the same
+    # sample stay decorrelated instead of summing one template coherently
+    closed_variants = np.arange(len(closed_starts)) % HIHAT_VARIANTS
+    kept = closed_starts < NUM_SAMPLES
+    
+    # Add open hi-hats on off-beats
+    open_starts = hihat_beats[hihat_beats % 4 == 2] * SAMPLES_PER_BEAT  # Every other beat
+    open_starts = open_starts[open_starts < NUM_SAMPLES]
+    
+    hihat_tracks = [
+        # (starts, templates, variants, velocities, pan)
+        (closed_starts[kept], _HIHAT_CLOSED, closed_variants[kept], closed_velocities[kept], -0.2),  # Slight left pan
+        (open_starts, _HIHAT_OPEN, np.arange(len(open_starts)) % HIHAT_VARIANTS,
+         np.full(len(open_starts), 0.5), 0.3),  # Slight right pan
+    ]
     
     # ========================================
     # DRUMS: Snares
@@ -428,9 +604,8 @@ def generate_song():
             actual_beat = beat + offset
             if actual_beat < total_beats:
                 sample = int(actual_beat * SAMPLES_PER_BEAT)
-                event = generate_808_bass(sample, dur, note, glide)
-                audio_events.append(event)
-                pan_positions.append(0.0)  # Center for bass
+                jobs.append((generate_808_bass, (sample, dur, note, glide)))
+                job_pans.append(0.0)  # Center for bass
     
     # ========================================
     # PIANO: Chords
@@ -449,9 +624,8 @@ def generate_song():
             actual_beat = beat + i * 4
             if actual_beat < total_beats:
                 sample = int(actual_beat * SAMPLES_PER_BEAT)
-                event = generate_piano_chord(sample, chord, duration)
-                audio_events.append(event)
-                pan_positions.append(-0.3)  # Slight left
+                jobs.append((generate_piano_chord, (sample, chord, duration)))
+                job_pans.append(-0.3)  # Slight left
     
     # ========================================
     # SYNTH: Pads
@@ -463,9 +637,8 @@ def generate_song():
             if actual_beat < total_beats:
                 sample = int(actual_beat * SAMPLES_PER_BEAT)
                 note = 48 + SCALE_NOTES[i % len(SCALE_NOTES)]  # C3 + scale
-                event = generate_synth_pad(sample, note, 8)
-                audio_events.append(event)
-                pan_positions.append(0.4)  # Right pan
+                jobs.append((generate_synth_pad, (sample, note, 8)))
+                job_pans.append(0.4)  # Right pan
     
     # ========================================
     # VOCALS: Synthesized
@@ -473,9 +646,8 @@ def generate_song():
     print("  - Generating vocals...")
     
     # Intro vocal (soft entry)
-    event = generate_vocal_formant(int(8 * SAMPLES_PER_BEAT), "hey", 4, 60)
-    audio_events.append(event)
-    pan_positions.append(0.0)
+    jobs.append((generate_vocal_formant, (int(8 * SAMPLES_PER_BEAT), "hey", 4, 60)))
+    job_pans.append(0.0)
     
     # Hook vocal phrases
     hook_lyrics = [
@@ -490,9 +662,8 @@ def generate_song():
             beat = hook_start + i * dur
             if beat < total_beats:
                 sample = int(beat * SAMPLES_PER_BEAT)
-                event = generate_vocal_formant(sample, text, dur, pitch)
-                audio_events.append(event)
-                pan_positions.append(0.0)
+                jobs.append((generate_vocal_formant, (sample, text, dur, pitch)))
+                job_pans.append(0.0)
     
     # Verse vocals
     verse_phrases = [
@@ -507,46 +678,36 @@ def generate_song():
             beat = verse_start + 4 + i * 4
             if beat < total_beats:
                 sample = int(beat * SAMPLES_PER_BEAT)
-                event = generate_vocal_formant(sample, text, dur, pitch)
-                audio_events.append(event)
-                pan_positions.append(0.0)
+                jobs.append((generate_vocal_formant, (sample, text, dur, pitch)))
+                job_pans.append(0.0)
     
     # ========================================
     # MIXING
     # ========================================
-    print("\nMixing audio tracks...")
+    print(f"\nRendering {len(jobs)} synth events...")
+    audio_events.extend(render_events(jobs))
+    pan_positions.extend(job_pans)
+    
+    print("Mixing audio tracks...")
     
     # Mix to stereo
     stereo_audio = mix_to_stereo(audio_events, pan_positions)
+    for starts, templates, variants, velocities, pan in hihat_tracks:
+        add_template_hits(stereo_audio, starts, templates, variants, velocities * 0.15, pan)
     
     # Apply effects
     print("Applying effects...")
     
-    # Apply reverb to both channels
-    for ch in range(2):
-        stereo_audio[ch] = apply_reverb(stereo_audio[ch], decay=0.25, room_size=0.35)
-    
-    # Apply compression
-    for ch in range(2):
-        stereo_audio[ch] = apply_compression(stereo_audio[ch], threshold=-15, ratio=3)
+    # Apply reverb, then compression and limiter, to both channels at once
+    stereo_audio = apply_reverb(stereo_audio, decay=0.25, room_size=0.35)
+    stereo_audio = apply_dynamics(stereo_audio, threshold=-15, ratio=3, ceiling=-0.1)
     
-    # Apply limiter
-    for ch in range(2):
-        stereo_audio[ch] = apply_limiter(stereo_audio[ch], ceiling=-0.1)
-    
-    # Normalize
-    max_amplitude = np.max(np.abs(stereo_audio))
-    if max_amplitude > 0:
-        stereo_audio /= max_amplitude
-        stereo_audio *= 0.9  # Leave some headroom
-    
-    # Convert to 16-bit integer
-    stereo_int16 = (stereo_audio * 32767).astype(np.int16)
-    
-    # Interleave channels for WAV file
-    output = np.zeros((NUM_SAMPLES, 2), dtype=np.int16)
-    output[:, 0] = stereo_int16[0]
-    output[:, 1] = stereo_int16[1]
+    # Normalize (leaving some headroom) and convert to 16-bit integer in one
+    # pass, writing straight into the interleaved (N, 2) buffer for the WAV file
+    max_amplitude = max(stereo_audio.max(), -stereo_audio.min())
+    scale = 0.9 * 32767 / max_amplitude if max_amplitude > 0 else 0.0
+    output = np.empty((NUM_SAMPLES, 2), dtype=np.int16)
+    np.multiply(stereo_audio.T, scale, out=output, casting='unsafe')
     
     return output
 
@@ -14,6 +14,9 @@ This script showcases:
 Output: 5 stereo WAV files at 44.1kHz, 16-bit
 """
 
+import contextlib
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
 from scipy import signal
 from scipy.io import wavfile
@@ -22,6 +25,12 @@ import sys
 import json
 import io
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure UTF-8 encoding for stdout to prevent UnicodeEncodeError
 if not sys.stdout.encoding or sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -38,16 +47,23 @@ PITCH_MAP = {
     'C5': 72, 'D5': 74, 'E5': 76
 }
 
+# Shared noise source (PCG64); seeded so renders are reproducible. Each
+# sample swaps in its own child stream of the same seed (see generate_samples)
+_SEED = 42
+_RNG = np.random.default_rng(_SEED)
+
 
+@functools.lru_cache(maxsize=128)
 def midi_to_freq(midi_note):
     """Convert MIDI note number to frequency in Hz."""
     return 440.0 * (2.0 ** ((midi_note - 69) / 12.0))
 
 
+@functools.lru_cache(maxsize=64)
 def generate_envelope(attack, decay, sustain, release, duration, sample_rate=SAMPLE_RATE):
-    """Generate ADSR envelope."""
+    """Generate ADSR envelope (cached by parameters; the result is read-only)."""
     num_samples = int(duration * sample_rate)
-    envelope = np.zeros(num_samples)
+    envelope = np.zeros(num_samples, dtype=np.float32)
     
     attack_samples = int(attack * sample_rate)
     decay_samples = int(decay * sample_rate)
@@ -75,9 +91,42 @@ def generate_envelope(attack, decay, sustain, release, duration, sample_rate=SAM
     if start < num_samples:
         envelope[start:] = np.linspace(sustain, 0, len(envelope[start:]))
     
+    # Shared between callers through the cache, so guard against in-place edits
+    envelope.setflags(write=False)
+    return envelope
+
+
+@functools.lru_cache(maxsize=16)
+def decay_envelope(num_samples, rate=10):
+    """Exponential decay from 1 to exp(-rate) over num_samples (cached; read-only)."""
+    envelope = np.exp(-np.linspace(0, rate, num_samples, dtype=np.float32))
+    envelope.setflags(write=False)
     return envelope
 
 
+@functools.lru_cache(maxsize=64)
+def _design_bandpass(low_hz, high_hz, sample_rate, order=2):
+    """Design a Butterworth bandpass as second-order sections (None if the band is empty)."""
+    nyquist = sample_rate / 2
+    low = max(0.01, low_hz / nyquist)
+    high = min(0.99, high_hz / nyquist)
+    if low >= high:
+        return None
+    return signal.butter(order, [low, high], btype='band', output='sos')
+
+
+def _band_bins(low_hz, high_hz, num_samples, sample_rate):
+    """rfft bin range [lo, hi) passing low_hz..high_hz (whole spectrum if the band is empty)."""
+    nyquist = sample_rate / 2
+    low = max(0.01, low_hz / nyquist) * nyquist
+    high = min(0.99, high_hz / nyquist) * nyquist
+    lo = int(np.ceil(low * num_samples / sample_rate))
+    hi = int(np.floor(high * num_samples / sample_rate)) + 1
+    if lo >= hi:
+        return 0, num_samples // 2 + 1
+    return lo, hi
+
+
 class VocalSynthesizer:
     """
     Formant-based vocal synthesizer for MAEVN pipeline.
@@ -105,8 +154,53 @@ class VocalSynthesizer:
         'ch': {'freq': 4500, 'bandwidth': 2500, 'duration': 0.08},
     }
     
+    # Letter -> phoneme; letters missing from the map are skipped
+    PHONEME_MAP = {
+        'a': 'a', 'e': 'e', 'i': 'i', 'o': 'o', 'u': 'u',
+        's': 's', 'f': 'f', 't': 't', 'k': 'k',
+        'd': 't', 'p': 't',   # Stops without their own noise profile
+        'h': 'a',             # Silent or breathy
+        'r': 'a',             # Approximate
+        'l': 'e',             # Approximate
+        'n': 'a',             # Nasal approximation
+        'm': 'u',             # Approximation
+    }
+    
+    # Glottal source harmonics and their spectral rolloff
+    NUM_HARMONICS = 19
+    HARMONIC_AMPS = (1.0 / np.arange(1, NUM_HARMONICS + 1, dtype=np.float64) ** 1.2).astype(np.float32)
+    
     def __init__(self, sample_rate=SAMPLE_RATE):
         self.sample_rate = sample_rate
+        
+        # Filter designs only depend on the sample rate, so build them once;
+        # formant banks are keyed by (formant_freqs, bandwidth)
+        self._formant_sos = {}
+        for freqs in self.FORMANTS.values():
+            self._formant_bank(freqs)
+        # Consonants only differ per call by their noise, so keep each one's
+        # (rfft passband bins, decay envelope) ready
+        self._consonant_cache = {}
+        for name, params in self.CONSONANTS.items():
+            num_samples = int(params['duration'] * sample_rate)
+            self._consonant_cache[name] = (
+                _band_bins(params['freq'] - params['bandwidth'] / 2,
+                           params['freq'] + params['bandwidth'] / 2, num_samples, sample_rate),
+                decay_envelope(num_samples),
+            )
+    
+    def _formant_bank(self, formant_freqs, bandwidth=100):
+        """Return (designing on first use) (sos, zi) per formant, skipping empty bands."""
+        key = (tuple(formant_freqs), bandwidth)
+        bank = self._formant_sos.get(key)
+        if bank is None:
+            bank = [_design_bandpass(formant - bandwidth, formant + bandwidth, self.sample_rate)
+                    for formant in formant_freqs]
+            # Unit-step steady-state filter states, scaled per call so each
+            # vowel starts settled instead of ringing in from zero
+            bank = [(sos, signal.sosfilt_zi(sos)) for sos in bank if sos is not None]
+            self._formant_sos[key] = bank
+        return bank
     
     def generate_glottal_pulse(self, duration, f0, vibrato_depth=0.02, vibrato_rate=5.0):
         """
@@ -122,20 +216,33 @@ class VocalSynthesizer:
             Glottal pulse train
         """
         num_samples = int(duration * self.sample_rate)
-        t = np.arange(num_samples) / self.sample_rate
-        
-        # Apply vibrato
-        vibrato = 1.0 + vibrato_depth * np.sin(2 * np.pi * vibrato_rate * t)
-        freq = f0 * vibrato
         
         # Generate glottal source with harmonics
-        phase = np.cumsum(2 * np.pi * freq / self.sample_rate)
-        source = np.zeros(num_samples)
+        if vibrato_depth == 0.0:
+            # Constant pitch: the running phase sum is a plain ramp
+            phase = (2 * np.pi * f0 / self.sample_rate) * np.arange(1, num_samples + 1)
+        else:
+            t = np.linspace(0, num_samples / self.sample_rate, num_samples, endpoint=False)
+            
+            # Apply vibrato
+            vibrato = 1.0 + vibrato_depth * np.sin(2 * np.pi * vibrato_rate * t)
+            freq = f0 * vibrato
+            phase = np.cumsum(2 * np.pi * freq / self.sample_rate)
+        
+        # One row per harmonic, filled with the recurrence
+        # sin((h+1)x) = 2cos(x) sin(hx) - sin((h-1)x) so only the fundamental
+        # needs sin/cos
+        # (phase stays float64 for pitch accuracy; the rows are stored as float32)
+        harmonics = np.empty((self.NUM_HARMONICS, num_samples), dtype=np.float32)
+        harmonics[0] = np.sin(phase)
+        two_cos = (2 * np.cos(phase)).astype(np.float32)
+        harmonics[1] = two_cos * harmonics[0]
+        for h in range(2, self.NUM_HARMONICS):
+            np.multiply(two_cos, harmonics[h - 1], out=harmonics[h])
+            harmonics[h] -= harmonics[h - 2]
         
         # Add harmonics with decreasing amplitude
-        for h in range(1, 20):
-            amp = 1.0 / (h ** 1.2)  # Spectral rolloff
-            source += amp * np.sin(h * phase)
+        source = self.HARMONIC_AMPS @ harmonics
         
         # Normalize - properly handle zero case
         max_val = np.max(np.abs(source))
@@ -155,17 +262,12 @@ class VocalSynthesizer:
         Returns:
             Formant-filtered signal
         """
-        nyquist = self.sample_rate / 2
         output = np.zeros_like(source)
         
-        for formant in formant_freqs:
-            low = max(0.01, (formant - bandwidth) / nyquist)
-            high = min(0.99, (formant + bandwidth) / nyquist)
-            
-            if low < high:
-                b, a = signal.butter(2, [low, high], btype='band')
-                filtered = signal.filtfilt(b, a, source)
-                output += filtered
+        # Single forward pass per band (parallel bands, summed)
+        for sos, zi in self._formant_bank(formant_freqs, bandwidth):
+            filtered, _ = signal.sosfilt(sos, source, zi=zi * source[0])
+            output += filtered
         
         return output
     
@@ -202,45 +304,50 @@ class VocalSynthesizer:
         envelope = generate_envelope(0.02, 0.05, 0.7, 0.15, duration, self.sample_rate)
         output *= envelope
         
-        # Normalize and apply amplitude
-        output /= np.max(np.abs(output) + 1e-8)
-        output *= amplitude
+        # Normalize and apply amplitude in one scale; the per-vowel peak sets
+        # the vowel/consonant balance, so it stays even though save_wav renormalizes
+        peak = max(output.max(), -output.min())
+        output *= amplitude / (peak + 1e-8)
         
         return output
     
-    def synthesize_consonant(self, consonant, amplitude=0.3):
+    def burst_length(self, consonant):
+        """Number of samples synthesize_consonant produces for `consonant`."""
+        return len(self._consonant_cache.get(consonant.lower(), self._consonant_cache['s'])[1])
+    
+    def noise_length(self, consonant):
+        """Number of Gaussian draws synthesize_consonant needs for `consonant`."""
+        (lo, hi), _ = self._consonant_cache.get(consonant.lower(), self._consonant_cache['s'])
+        return 2 * (hi - lo)
+    
+    def synthesize_consonant(self, consonant, amplitude=0.3, noise=None):
         """
-        Synthesize a consonant sound using filtered noise.
+        Synthesize a consonant sound using band-limited noise.
         
         Args:
             consonant: Consonant type ('s', 'sh', 'f', 't', 'k', 'ch')
             amplitude: Output amplitude
+            noise: Optional pre-drawn float32 standard normals, noise_length(consonant)
+                of them; drawn from the module RNG when omitted
         
         Returns:
             Synthesized consonant audio
         """
-        params = self.CONSONANTS.get(consonant.lower(), self.CONSONANTS['s'])
-        
-        duration = params['duration']
-        num_samples = int(duration * self.sample_rate)
-        
-        # Generate noise
-        noise = np.random.randn(num_samples)
-        
-        # Apply bandpass filter
-        nyquist = self.sample_rate / 2
-        low = max(0.01, (params['freq'] - params['bandwidth'] / 2) / nyquist)
-        high = min(0.99, (params['freq'] + params['bandwidth'] / 2) / nyquist)
-        
-        if low < high:
-            b, a = signal.butter(2, [low, high], btype='band')
-            output = signal.filtfilt(b, a, noise)
-        else:
-            output = noise
-        
-        # Apply short envelope
-        envelope = np.exp(-np.linspace(0, 10, num_samples))
-        output *= envelope * amplitude
+        (lo, hi), envelope = self._consonant_cache.get(consonant.lower(), self._consonant_cache['s'])
+        num_samples = len(envelope)
+        num_bins = hi - lo
+        
+        # Generate the noise directly in the frequency domain: random
+        # real/imaginary parts in the passband, zeros elsewhere
+        if noise is None:
+            noise = _RNG.standard_normal(2 * num_bins, dtype=np.float32)
+        spectrum = np.zeros(num_samples // 2 + 1, dtype=np.complex64)
+        spectrum.real[lo:hi] = noise[:num_bins]
+        spectrum.imag[lo:hi] = noise[num_bins:]
+        output = np.fft.irfft(spectrum, n=num_samples)
+        
+        # Apply short envelope; sqrt(n/2) gives the level of unit white noise
+        output *= envelope * (amplitude * np.sqrt(num_samples / 2))
         
         return output
     
@@ -259,9 +366,26 @@ class VocalSynthesizer:
         """
         num_phonemes = len(phonemes)
         phoneme_duration = duration / num_phonemes
-        
-        output_segments = []
-        
+        seg_len = int(phoneme_duration * self.sample_rate)
+        
+        # Every segment is seg_len long, except consonants whose noise burst
+        # runs longer; size the output up front and write segments in place
+        burst_lens = [
+            self.burst_length(phoneme)
+            if phoneme.lower() not in self.FORMANTS and phoneme.lower() in self.CONSONANTS
+            else 0
+            for phoneme in phonemes
+        ]
+        seg_lens = [max(seg_len, burst_len) for burst_len in burst_lens]
+        output = np.zeros(sum(seg_lens), dtype=np.float32)
+        
+        # Draw the noise for every consonant in the word in one call
+        noise_lens = [self.noise_length(phoneme) if burst_len else 0
+                      for phoneme, burst_len in zip(phonemes, burst_lens)]
+        noise_pool = _RNG.standard_normal(sum(noise_lens), dtype=np.float32)
+        
+        offset = 0
+        noise_offset = 0
         for i, phoneme in enumerate(phonemes):
             # Calculate pitch for this phoneme
             if pitch_contour and i < len(pitch_contour):
@@ -273,19 +397,16 @@ class VocalSynthesizer:
             if phoneme.lower() in self.FORMANTS:
                 segment = self.synthesize_vowel(phoneme, phoneme_duration, pitch)
             elif phoneme.lower() in self.CONSONANTS:
-                segment = self.synthesize_consonant(phoneme)
-                # Pad consonant to match vowel duration
-                if len(segment) < int(phoneme_duration * self.sample_rate):
-                    padding = np.zeros(int(phoneme_duration * self.sample_rate) - len(segment))
-                    segment = np.concatenate([segment, padding])
+                # Shorter consonants are left zero-padded to the vowel duration
+                noise = noise_pool[noise_offset:noise_offset + noise_lens[i]]
+                noise_offset += noise_lens[i]
+                segment = self.synthesize_consonant(phoneme, noise=noise)
             else:
                 # Default to 'a' vowel
                 segment = self.synthesize_vowel('a', phoneme_duration, pitch)
             
-            output_segments.append(segment)
-        
-        # Concatenate all segments
-        output = np.concatenate(output_segments)
+            output[offset:offset + len(segment)] = segment
+            offset += seg_lens[i]
         
         return output
     
@@ -299,101 +420,119 @@ class VocalSynthesizer:
         Returns:
             List of phonemes
         """
-        # Simple vowel detection
-        vowels = set('aeiouAEIOU')
-        phonemes = []
-        
-        for char in text.lower():
-            if char in vowels:
-                phonemes.append(char)
-            elif char in 'bcdfghjklmnpqrstvwxyz':
-                # Map common consonants
-                if char == 's':
-                    phonemes.append('s')
-                elif char == 'h':
-                    phonemes.append('a')  # Silent or breathy
-                elif char in 'tdkp':
-                    phonemes.append(char if char in self.CONSONANTS else 't')
-                elif char == 'f':
-                    phonemes.append('f')
-                elif char == 'r':
-                    phonemes.append('a')  # Approximate
-                elif char == 'l':
-                    phonemes.append('e')  # Approximate
-                elif char == 'n':
-                    phonemes.append('a')  # Nasal approximation
-                elif char == 'm':
-                    phonemes.append('u')  # Approximation
+        phoneme_map = self.PHONEME_MAP
+        phonemes = [phoneme_map[char] for char in text.lower() if char in phoneme_map]
         
         return phonemes if phonemes else ['a']
 
 
+# Reverb delay taps (seconds, gain)
+REVERB_TAPS = [(0.023, 0.6), (0.041, 0.5), (0.067, 0.4), (0.089, 0.3), (0.113, 0.25), (0.151, 0.2)]
+REVERB_DELAYS = np.array([int(SAMPLE_RATE * d) for d, _ in REVERB_TAPS], dtype=np.int64)
+REVERB_GAINS = np.array([gain for _, gain in REVERB_TAPS])
+
+
+def _reverb_numpy(audio, delays, gains):
+    """Add each delayed, scaled copy of audio onto it (tail past the input dropped)."""
+    num_samples = len(audio)
+    reverb = audio.copy()
+    
+    # One scratch buffer serves every tap, so no per-tap temporaries
+    scratch = np.empty_like(audio)
+    for delay, gain in zip(delays.tolist(), gains.tolist()):
+        if delay < num_samples:
+            tap = scratch[:num_samples - delay]
+            np.multiply(audio[:num_samples - delay], gain, out=tap)
+            reverb[delay:] += tap
+    return reverb
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _reverb_kernel(audio, delays, gains):
+        """Multi-tap reverb in one pass: each output sample gathers its delayed inputs."""
+        reverb = np.empty_like(audio)
+        for n in range(audio.size):
+            acc = audio[n]
+            for tap in range(delays.size):
+                if n >= delays[tap]:
+                    acc += audio[n - delays[tap]] * gains[tap]
+            reverb[n] = acc
+        return reverb
+else:
+    _reverb_kernel = _reverb_numpy
+
+
 def apply_reverb(audio, decay=0.3, room_size=0.4):
     """Apply reverb effect to audio."""
-    num_samples = len(audio)
-    reverb_length = num_samples + int(SAMPLE_RATE * 2)
-    reverb = np.zeros(reverb_length)
-    reverb[:num_samples] = audio
-    
     # Multiple delay taps for realistic reverb
-    delays = [int(SAMPLE_RATE * d) for d in [0.023, 0.041, 0.067, 0.089, 0.113, 0.151]]
-    gains = [0.6, 0.5, 0.4, 0.3, 0.25, 0.2]
-    
-    for delay, gain in zip(delays, gains):
-        end_idx = min(delay + num_samples, reverb_length)
-        samples_to_add = end_idx - delay
-        if samples_to_add > 0:
-            reverb[delay:end_idx] += audio[:samples_to_add] * gain * decay * room_size
-    
-    return reverb[:num_samples]
+    gains = REVERB_GAINS * (decay * room_size)
+    return _reverb_kernel(np.ascontiguousarray(audio), REVERB_DELAYS, gains)
 
 
-def apply_limiter(audio, ceiling=-0.1):
-    """Apply brick-wall limiter."""
+def apply_limiter(audio, ceiling=-0.1, inplace=False):
+    """Apply brick-wall limiter, clipping `audio` itself when inplace is True."""
     ceiling_linear = 10 ** (ceiling / 20)
-    return np.clip(audio, -ceiling_linear, ceiling_linear)
+    return np.clip(audio, -ceiling_linear, ceiling_linear, out=audio if inplace else None)
 
 
-def normalize_audio(audio, target_db=-3):
-    """Normalize audio to target dB level.
-    
-    Args:
-        audio: Input audio array (not modified)
-        target_db: Target level in dB
-    
-    Returns:
-        New normalized audio array
-    """
-    target_linear = 10 ** (target_db / 20)
-    max_amplitude = np.max(np.abs(audio))
-    if max_amplitude > 0:
-        normalized = audio / max_amplitude * target_linear
-    else:
-        normalized = audio.copy()
-    return normalized
+def _finalize_numpy(audio, scale, ceiling_linear):
+    """Clip mono audio to +/- ceiling_linear, scale it and write it to both int16 channels."""
+    audio_int16 = np.empty((len(audio), 2), dtype=np.int16)
+    limited = np.clip(audio, -ceiling_linear, ceiling_linear)
+    np.multiply(limited[:, None], scale, out=audio_int16, casting='unsafe')
+    return audio_int16
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _finalize_int16_stereo(audio, scale, ceiling_linear):
+        """Limit, scale, duplicate to L/R and convert to int16 in one pass."""
+        audio_int16 = np.empty((audio.size, 2), dtype=np.int16)
+        for i in range(audio.size):
+            value = min(max(audio[i], -ceiling_linear), ceiling_linear) * scale
+            audio_int16[i, 0] = audio_int16[i, 1] = np.int16(value)
+        return audio_int16
+else:
+    _finalize_int16_stereo = _finalize_numpy
 
 
-def save_wav(audio, filepath, sample_rate=SAMPLE_RATE, stereo=True):
-    """Save audio to WAV file."""
+def save_wav(audio, filepath, sample_rate=SAMPLE_RATE, stereo=True, ceiling=None, target_db=-3,
+             io_pool=None):
+    """
+    Save audio to WAV file, optionally brick-wall limiting it to `ceiling` dB first.
+    
+    With an `io_pool` executor the file write runs there and a Future
+    resolving to the path is returned instead of the path.
+    """
     # Ensure output directory exists
     os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else '.', exist_ok=True)
     
-    # Convert to stereo if needed
-    if stereo and len(audio.shape) == 1:
-        stereo_audio = np.zeros((len(audio), 2))
-        stereo_audio[:, 0] = audio
-        stereo_audio[:, 1] = audio
-        audio = stereo_audio
-    
-    # Normalize
-    audio = normalize_audio(audio)
+    # The limited peak is known up front, so normalization folds into one scale
+    ceiling_linear = 10 ** (ceiling / 20) if ceiling is not None else np.inf
+    peak = min(max(audio.max(), -audio.min()), ceiling_linear)
+    scale = 10 ** (target_db / 20) / peak * 32767 if peak > 0 else 0.0
     
-    # Convert to 16-bit
-    audio_int16 = (audio * 32767).astype(np.int16)
+    if stereo and len(audio.shape) == 1:
+        # Limit, normalize, convert to stereo and to 16-bit in a single pass
+        audio_int16 = _finalize_int16_stereo(np.ascontiguousarray(audio), scale, ceiling_linear)
+    else:
+        if ceiling is not None:
+            audio = apply_limiter(audio, ceiling)
+        
+        # Normalize straight into the 16-bit buffer
+        audio_int16 = np.empty(audio.shape, dtype=np.int16)
+        np.multiply(audio, scale, out=audio_int16, casting='unsafe')
     
     # Save
+    if io_pool is not None:
+        return io_pool.submit(_write_wav, filepath, sample_rate, audio_int16)
+    return _write_wav(filepath, sample_rate, audio_int16)
+
+
+def _write_wav(filepath, sample_rate, audio_int16):
+    """Write an int16 WAV file and return its path."""
     wavfile.write(filepath, sample_rate, audio_int16)
-    
     return filepath
 
 
@@ -460,7 +599,7 @@ SAMPLES = [
 ]
 
 
-def generate_sample(sample_config, synth, output_dir):
+def generate_sample(sample_config, synth, output_dir, io_pool=None):
     """
     Generate a single text-to-vocal sample.
     
@@ -468,9 +607,10 @@ def generate_sample(sample_config, synth, output_dir):
         sample_config: Configuration dict for the sample
         synth: VocalSynthesizer instance
         output_dir: Output directory for WAV file
+        io_pool: Optional executor to write the WAV file on
     
     Returns:
-        Path to generated WAV file
+        Path to generated WAV file (a Future resolving to it when io_pool is given)
     """
     name = sample_config['name']
     print(f"\n  Generating: {name}")
@@ -492,12 +632,19 @@ def generate_sample(sample_config, synth, output_dir):
         # Add slight distortion for trap style
         audio = np.tanh(audio * 1.5) * 0.8
     elif style == 'chop':
-        # Add rhythmic chopping effect
+        # Add rhythmic chopping effect: a 1 -> 0.3 ramp at the start of every
+        # other chop period, written into one gain curve
         num_samples = len(audio)
         chop_period = num_samples // 6
-        for i in range(0, num_samples, chop_period * 2):
-            end = min(i + chop_period // 4, num_samples)
-            audio[i:end] *= np.linspace(1, 0.3, end - i)
+        ramp_length = chop_period // 4
+        starts = np.arange(0, num_samples, chop_period * 2)
+        gain = np.ones(num_samples, dtype=np.float32)
+        full = starts[starts + ramp_length <= num_samples]
+        gain[full[:, None] + np.arange(ramp_length)] = np.linspace(1, 0.3, ramp_length, dtype=np.float32)
+        for start in starts[starts + ramp_length > num_samples]:
+            # A ramp cut short by the end of the clip is squeezed to fit
+            gain[start:] = np.linspace(1, 0.3, num_samples - start, dtype=np.float32)
+        audio *= gain
     elif style == 'rnb':
         # Smoother with more vibrato (already in synthesizer)
         pass
@@ -512,20 +659,70 @@ def generate_sample(sample_config, synth, output_dir):
     reverb_amount = sample_config.get('reverb', 0.3)
     audio = apply_reverb(audio, decay=reverb_amount, room_size=0.4)
     
-    # Apply limiter
-    audio = apply_limiter(audio)
-    
-    # Save WAV file
+    # Apply limiter and save WAV file
     output_path = os.path.join(output_dir, f"{name}.wav")
-    save_wav(audio, output_path)
+    result = save_wav(audio, output_path, ceiling=-0.1, io_pool=io_pool)
     
-    # Print info
-    file_size = os.path.getsize(output_path)
+    # Print info; the write may still be in flight, so size it from the
+    # 44-byte PCM header plus 16-bit stereo frames
+    file_size = 44 + len(audio) * 2 * 2
     print(f"    Duration: {sample_config['duration']:.1f}s")
     print(f"    Output: {output_path}")
     print(f"    Size: {file_size / 1024:.1f} KB")
     
-    return output_path
+    return result
+
+
+@contextlib.contextmanager
+def _noise_stream(seed):
+    """Draw the module's noise from default_rng(seed) inside the block."""
+    global _RNG
+    shared_rng, _RNG = _RNG, np.random.default_rng(seed)
+    try:
+        yield
+    finally:
+        _RNG = shared_rng
+
+
+def generate_sample_standalone(sample_config, output_dir, seed):
+    """
+    Generate one sample with its own synthesizer and noise stream (worker-process entry point).
+    
+    Returns:
+        (path to generated WAV file, captured progress output)
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log), _noise_stream(seed):
+        output_path = generate_sample(sample_config, VocalSynthesizer(SAMPLE_RATE), output_dir)
+    return output_path, log.getvalue()
+
+
+def generate_samples(sample_configs, output_dir):
+    """Generate samples in order, spread over worker processes when several CPUs are available."""
+    # Every sample draws from its own child of the fixed seed, keyed by its
+    # index, so the output doesn't depend on which process renders it
+    seeds = np.random.SeedSequence(_SEED).spawn(len(sample_configs))
+    
+    workers = min(os.cpu_count() or 1, len(sample_configs))
+    if workers < 2:
+        # Hand each WAV write to a thread so disk I/O overlaps the next synthesis
+        synth = VocalSynthesizer(SAMPLE_RATE)
+        with ThreadPoolExecutor(max_workers=2) as io_pool:
+            writes = []
+            for config, seed in zip(sample_configs, seeds):
+                with _noise_stream(seed):
+                    writes.append(generate_sample(config, synth, output_dir, io_pool=io_pool))
+            return [write.result() for write in writes]
+    
+    # Progress output is replayed in sample order
+    generated_files = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(generate_sample_standalone, sample_configs,
+                               [output_dir] * len(sample_configs), seeds)
+        for output_path, log in results:
+            print(log, end='')
+            generated_files.append(output_path)
+    return generated_files
 
 
 def generate_manifest(samples_info, output_dir):
@@ -564,20 +761,14 @@ def main():
     os.makedirs(output_dir, exist_ok=True)
     print(f"\nOutput directory: {output_dir}")
     
-    # Initialize synthesizer
-    synth = VocalSynthesizer(SAMPLE_RATE)
-    
     # Generate all samples
-    samples_info = []
-    generated_files = []
-    
     print("\n" + "-" * 70)
     print("Generating samples...")
     
-    for sample_config in SAMPLES:
-        output_path = generate_sample(sample_config, synth, output_dir)
-        generated_files.append(output_path)
-        
+    generated_files = generate_samples(SAMPLES, output_dir)
+    
+    samples_info = []
+    for sample_config, output_path in zip(SAMPLES, generated_files):
         samples_info.append({
             'name': sample_config['name'],
             'description': sample_config['description'],